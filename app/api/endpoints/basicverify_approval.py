@@ -1,72 +1,54 @@
+import asyncio
 import logging
 from fastapi import APIRouter, HTTPException
+from app.services.database_service import database_service
 from app.models.schemas import BasicVerifyApprovalRequest, BasicVerifyApprovalResponse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["basicverify_approval"])
 
+# basicVerifyStatus -> (success, response message, outcome, echo basicVerifyData back)
+BASIC_VERIFY_STATUS_CONFIG = {
+    "RejectedByBasic": (False, "Basic verification was rejected", "rejection", True),
+    "VerifiedByBasic": (True, "Basic verification was accepted", "acceptance", False),
+}
+
 @router.post("/basicverify_approval", response_model=BasicVerifyApprovalResponse)
-def basicverify_approval(request: BasicVerifyApprovalRequest):
+async def basicverify_approval(request: BasicVerifyApprovalRequest):
     logger.info(f"Basic Verify Approval request received: {request}")
 
     if not request.basicVerifyData:
         raise HTTPException(status_code=400, detail="Basic Verify Data is required")
 
-    if request.basicVerifyStatus == "RejectedByBasic":
-        logger.info(f"Basic Verify Status is Rejected with comments: {request.rejectionComments}")
-
-        # Update the database with the rejection comments
-        from app.services.database_service import database_service
-
-        db_result = database_service.update_basic_verify_status(
-            verification_id=request.basicVerifyData.get("ai_disbursement_id"),
-            verification_status="RejectedByBasic",
-            comments=request.rejectionComments
-        )
-
-        if db_result:
-            logger.info(f"Disbursement status updated to RejectedByBasic for AI Disbursement ID: {request.basicVerifyData.get('ai_disbursement_id')}")
-        else:
-            logger.error(f"Failed to update disbursement status for AI Disbursement ID: {request.basicVerifyData.get('ai_disbursement_id')}")
-
-        return BasicVerifyApprovalResponse(
-            success=False,
-            message="Basic verification was rejected",
-            data={
-                "status": "RejectedByBasic",
-                "ai_disbursement_id": request.basicVerifyData.get("ai_disbursement_id"),
-                "basicVerifyData": request.basicVerifyData,
-                "comments": request.rejectionComments,
-                "message": "Verification process completed with rejection"
-            }
-        )
-    elif request.basicVerifyStatus == "VerifiedByBasic":
-        logger.info(f"Basic Verify Status is Verified with comments: {request.rejectionComments}")
-
-        # Update the database with the acceptance comments
-        from app.services.database_service import database_service
-
-        db_result = database_service.update_basic_verify_status(
-            verification_id=request.basicVerifyData.get("ai_disbursement_id"),
-            verification_status="VerifiedByBasic",
-            comments=request.rejectionComments
-        )
-
-        if db_result:
-            logger.info(f"Disbursement status updated to VerifiedByBasic for AI Disbursement ID: {request.basicVerifyData.get('ai_disbursement_id')}")
-        else:
-            logger.error(f"Failed to update disbursement status for AI Disbursement ID: {request.basicVerifyData.get('ai_disbursement_id')}")
-
-        return BasicVerifyApprovalResponse(
-            success=True,
-            message="Basic verification was accepted",
-            data={
-                "status": "VerifiedByBasic",
-                "ai_disbursement_id": request.basicVerifyData.get("ai_disbursement_id"),
-                "comments": request.rejectionComments,
-                "message": "Verification process completed with acceptance"
-            }
-        )
-
-    
\ No newline at end of file
+    status = request.basicVerifyStatus
+    success, message, outcome, echo_data = BASIC_VERIFY_STATUS_CONFIG[status]
+    ai_disbursement_id = request.basicVerifyData.get("ai_disbursement_id")
+    comments = request.rejectionComments
+
+    logger.info(f"Basic Verify Status is {status} with comments: {comments}")
+
+    # Update the database with the verification comments
+    # Supabase client is synchronous, keep the write off the event loop
+    db_result = await asyncio.to_thread(
+        database_service.update_basic_verify_status,
+        verification_id=ai_disbursement_id,
+        verification_status=status,
+        comments=comments
+    )
+
+    if db_result:
+        logger.info(f"Disbursement status updated to {status} for AI Disbursement ID: {ai_disbursement_id}")
+    else:
+        logger.error(f"Failed to update disbursement status for AI Disbursement ID: {ai_disbursement_id}")
+
+    data = {
+        "status": status,
+        "ai_disbursement_id": ai_disbursement_id,
+        "comments": comments,
+        "message": f"Verification process completed with {outcome}"
+    }
+    if echo_data:
+        data["basicVerifyData"] = request.basicVerifyData
+
+    return BasicVerifyApprovalResponse(success=success, message=message, data=data)
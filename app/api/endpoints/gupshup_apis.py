@@ -3,19 +3,43 @@ Modular Gupshup WhatsApp API Endpoints
 Comprehensive wrapper for all Gupshup outbound messaging APIs
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, validator
-import json
+import asyncio
+import logging
+import random
+import weakref
+from contextlib import nullcontext
+from uuid import uuid4
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Annotated, Literal, Optional, List, Dict, Any
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator
 import httpx
+import orjson
+from functools import lru_cache, partial
+from types import MappingProxyType
+from urllib.parse import quote_plus, urlencode
 from app.config.settings import settings
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
+from app.services.gupshup_client import gupshup_admission, gupshup_client_for, gupshup_rate_limiter, gupshup_send_queue, gupshup_send_queue_closed
 from app.utils.validators import normalize_phone_number
 
+logger = logging.getLogger(__name__)
+
 # Create router
 router = APIRouter(prefix="/api_v1/gupshup", tags=["Gupshup WhatsApp APIs"])
 
+# Template listings change rarely; keep them for 10 minutes per (app_name, template_status)
+templates_cache: TTLCache = TTLCache(maxsize=128, ttl=600)
+# One lock per cache key, so a slow fetch only holds up requests for the same listing
+templates_cache_locks = weakref.WeakValueDictionary()
+
 # ==================== SCHEMAS ====================
 
+MediaType = Literal["image", "document", "audio", "video"]
+InteractiveType = Literal["button", "list"]
+BulkMessageType = Literal["text", "template", "media"]
+
 class BaseGupshupResponse(BaseModel):
     """Base response model for all Gupshup APIs"""
     success: bool
@@ -31,33 +55,43 @@ class PhoneNumberRequest(BaseAppRequest):
     """Base request with phone number validation and app name"""
     phone_number: str = Field(..., description="Phone number (supports multiple formats)")
     
-    @validator('phone_number')
+    @field_validator('phone_number')
+    @classmethod
     def validate_phone_number(cls, v):
         return normalize_phone_number(v)
 
-class TemplateMessageRequest(PhoneNumberRequest):
-    """Request for template-based messages"""
+class TemplateContent(BaseModel):
+    """Template fields, shared by template requests and bulk message_data"""
     template_id: str = Field(..., description="Gupshup template ID")
     template_params: List[str] = Field(default=[], description="Template parameters")
+
+class TemplateMessageRequest(PhoneNumberRequest, TemplateContent):
+    """Request for template-based messages"""
     source_name: Optional[str] = Field(None, description="Custom source name")
 
-class TextMessageRequest(PhoneNumberRequest):
+class TextContent(BaseModel):
+    """Text message fields, shared by text requests and bulk message_data"""
+    message: str = Field(..., description="Text message to send")
+
+class TextMessageRequest(PhoneNumberRequest, TextContent):
     """Request for simple text messages"""
     app_name: str = Field(..., description="Gupshup app name (e.g., 'homi', 'orbit')")
     phone_number: str = Field(..., description="Phone number (supports multiple formats)")
-    message: str = Field(..., description="Text message to send")
     source_name: Optional[str] = Field(None, description="Custom source name")
 
-class MediaMessageRequest(PhoneNumberRequest):
-    """Request for media messages"""
-    media_type: str = Field(..., description="Media type: image, document, audio, video")
+class MediaContent(BaseModel):
+    """Media fields, shared by media requests and bulk message_data"""
+    media_type: MediaType = Field(..., description="Media type: image, document, audio, video")
     media_url: str = Field(..., description="URL of the media file")
     caption: Optional[str] = Field(None, description="Caption for the media")
     filename: Optional[str] = Field(None, description="Filename for documents")
 
+class MediaMessageRequest(PhoneNumberRequest, MediaContent):
+    """Request for media messages"""
+
 class InteractiveMessageRequest(PhoneNumberRequest):
     """Request for interactive messages (buttons, lists)"""
-    interactive_type: str = Field(..., description="Type: button, list")
+    interactive_type: InteractiveType = Field(..., description="Type: button, list")
     header: Optional[Dict[str, Any]] = Field(None, description="Message header")
     body: Dict[str, Any] = Field(..., description="Message body")
     footer: Optional[Dict[str, Any]] = Field(None, description="Message footer")
@@ -77,9 +111,11 @@ class ContactMessageRequest(PhoneNumberRequest):
 class BulkMessageRequest(BaseAppRequest):
     """Request for bulk messaging"""
     phone_numbers: List[str] = Field(..., description="List of phone numbers")
-    message_type: str = Field(..., description="Type: text, template, media")
+    message_type: BulkMessageType = Field(..., description="Type: text, template, media")
     message_data: Dict[str, Any] = Field(..., description="Message data based on type")
-    delay_between_messages: Optional[int] = Field(5, description="Delay in seconds between messages")
+    delay_between_messages: Optional[int] = Field(None, description="Deprecated: minimum seconds between messages, applied as a rate of one message per delay")
+    max_rate: Optional[float] = Field(None, ge=1, description="Maximum messages per second for this batch; the app-wide Gupshup limit always applies as well")
+    max_concurrency: Optional[int] = Field(10, ge=1, description="Maximum number of messages sent concurrently")
 
 class MessageStatusRequest(BaseModel):
     """Request to check message status"""
@@ -326,16 +362,28 @@ def get_gupshup_headers(app_config: dict) -> Dict[str, str]:
         app_config: App configuration dict with api_key
         
     Returns:
-        Dict: Headers for Gupshup API requests
+        Dict: Read-only headers for Gupshup API requests, shared per API key
     """
-    return {
+    return _gupshup_headers_for_key(app_config["api_key"])
+
+@lru_cache(maxsize=32)
+def _gupshup_headers_for_key(api_key: str) -> Dict[str, str]:
+    return MappingProxyType({
         'cache-control': 'no-cache',
         "accept": "application/json",
         'content-type': 'application/x-www-form-urlencoded',
-        'apikey': app_config["api_key"]
-    }
+        'apikey': api_key
+    })
 
-async def send_template_message(app_config: dict, destination: str, template_id: str, template_params: List[str] = None, source_name: str = None) -> Dict[str, Any]:
+def dump_json(payload: Any) -> str:
+    """Serialize a Gupshup message or template payload to a JSON string"""
+    return orjson.dumps(payload).decode()
+
+# Text messages have a fixed envelope; only the JSON-escaped text is filled in per send.
+# Produces exactly what dump_json({"type": "text", "text": ...}) would.
+TEXT_MESSAGE_JSON = '{{"type":"text","text":{text}}}'
+
+async def send_gupshup_template_message(app_config: dict, destination: str, template_id: str, template_params: List[str] = None, source_name: str = None) -> Dict[str, Any]:
     """
     Send a template message using Gupshup API
     
@@ -349,57 +397,14 @@ async def send_template_message(app_config: dict, destination: str, template_id:
     Returns:
         Dict containing success status and response data
     """
-    try:
-        headers = get_gupshup_headers(app_config)
-        
-        data = {
-            'channel': 'whatsapp',
-            'source': app_config["source"],
-            'destination': destination,
-            'template': json.dumps({
-                "id": template_id,
-                "params": template_params or []
-            })
-        }
-        
-        if source_name:
-            data['src.name'] = source_name
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                settings.GUPSHUP_API_TEMPLATE_URL,
-                headers=headers,
-                data=data,
-                timeout=30.0
-            )
-            
-            if response.status_code in [200, 202]:
-                try:
-                    response_data = response.json()
-                    return {
-                        "success": True,
-                        "data": response_data,
-                        "status_code": response.status_code
-                    }
-                except json.JSONDecodeError:
-                    return {
-                        "success": True,
-                        "data": {"response": response.text},
-                        "status_code": response.status_code
-                    }
-            else:
-                return {
-                    "success": False,
-                    "error": f"HTTP {response.status_code}: {response.text}",
-                    "status_code": response.status_code
-                }
-                
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e),
-            "status_code": 500
-        }
+    payload_json = dump_json({
+        "id": template_id,
+        "params": template_params or []
+    })
+    return await send_serialized_message(
+        app_config, get_gupshup_headers(app_config), settings.GUPSHUP_API_TEMPLATE_URL, "template",
+        destination, payload_json, source_name
+    )
 
 async def send_session_message(app_config: dict, destination: str, message_data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -413,51 +418,10 @@ async def send_session_message(app_config: dict, destination: str, message_data:
     Returns:
         Dict containing success status and response data
     """
-    try:
-        headers = get_gupshup_headers(app_config)
-        
-        data = {
-            'channel': 'whatsapp',
-            'source': app_config["source"],
-            'destination': destination,
-            'message': json.dumps(message_data)
-        }
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                settings.GUPSHUP_API_MSG_URL,
-                headers=headers,
-                data=data,
-                timeout=30.0
-            )
-            
-            if response.status_code in [200, 202]:
-                try:
-                    response_data = response.json()
-                    return {
-                        "success": True,
-                        "data": response_data,
-                        "status_code": response.status_code
-                    }
-                except json.JSONDecodeError:
-                    return {
-                        "success": True,
-                        "data": {"response": response.text},
-                        "status_code": response.status_code
-                    }
-            else:
-                return {
-                    "success": False,
-                    "error": f"HTTP {response.status_code}: {response.text}",
-                    "status_code": response.status_code
-                }
-                
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e),
-            "status_code": 500
-        }
+    return await send_serialized_message(
+        app_config, get_gupshup_headers(app_config), settings.GUPSHUP_API_MSG_URL, "message",
+        destination, dump_json(message_data)
+    )
 
 async def get_templates_from_gupshup(app_id: str, api_key: str, template_status: str = None) -> Dict[str, Any]:
     """
@@ -483,16 +447,16 @@ async def get_templates_from_gupshup(app_id: str, api_key: str, template_status:
             "templateStatus": template_status if template_status else None
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, params=params)
-            response.raise_for_status()
+        async with gupshup_admission:
+            response = await gupshup_client_for(url).get(url, headers=headers, params=params)
+        response.raise_for_status()
             
-            result = response.json()
-            return {
-                "success": True,
-                "data": result,
-                "status_code": response.status_code
-            }
+        result = orjson.loads(response.content)
+        return {
+            "success": True,
+            "data": result,
+            "status_code": response.status_code
+        }
             
     except httpx.HTTPStatusError as e:
         return {
@@ -507,55 +471,287 @@ async def get_templates_from_gupshup(app_id: str, api_key: str, template_status:
             "status_code": 500
         }
 
-async def send_gupshup_request(api_url: str, data: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
-    """Generic function to send requests to Gupshup API"""
+@lru_cache(maxsize=32)
+def gupshup_form_prefix(source: str) -> str:
+    """URL-encoded channel and source fields, fixed per sending number"""
+    return urlencode({'channel': 'whatsapp', 'source': source})
+
+def encode_form_field(name: str, value: str) -> str:
+    """URL-encode a single form field"""
+    return urlencode({name: value})
+
+async def send_serialized_message(
+    app_config: dict,
+    headers: Dict[str, str],
+    api_url: str,
+    payload_field: str,
+    destination: str,
+    payload_json: str,
+    source_name: str = None
+) -> Dict[str, Any]:
+    """
+    Send an already serialized message or template payload to one destination
+    
+    Args:
+        app_config: App configuration with source number
+        headers: Gupshup headers for the app
+        api_url: Gupshup message or template API URL
+        payload_field: Form field carrying the payload ('message' or 'template')
+        destination: Normalized destination phone number
+        payload_json: JSON-encoded payload
+        source_name: Optional custom source name
+        
+    Returns:
+        Dict containing success status and response data
+    """
+    return await send_encoded_message(
+        app_config, headers, api_url, destination, encode_form_field(payload_field, payload_json), source_name
+    )
+
+async def send_encoded_message(
+    app_config: dict,
+    headers: Dict[str, str],
+    api_url: str,
+    destination: str,
+    encoded_payload: str,
+    source_name: str = None
+) -> Dict[str, Any]:
+    """
+    Send a payload that is already URL-encoded as a form field to one destination
+    
+    Bulk sends encode their shared payload once and pass it here for every
+    recipient; single sends go through send_serialized_message.
+    """
+    form_body = (
+        f"{gupshup_form_prefix(app_config['source'])}"
+        f"&destination={quote_plus(destination)}"
+        f"&{encoded_payload}"
+    )
+    
+    if source_name:
+        form_body += f"&{encode_form_field('src.name', source_name)}"
+    
+    return await send_gupshup_request(api_url, form_body, headers)
+
+def build_media_message(media_type: str, media_url: str, caption: str = None, filename: str = None) -> Dict[str, Any]:
+    """Build a Gupshup media message payload"""
+    media_message = {
+        "type": media_type,
+        "url": media_url
+    }
+    
+    if caption:
+        media_message["caption"] = caption
+    
+    if filename and media_type == "document":
+        media_message["filename"] = filename
+    
+    return media_message
+
+async def dispatch_text_message(app_config: dict, headers: Dict[str, str], destination: str, message: str, source_name: str = None) -> Dict[str, Any]:
+    """Send a text message to an already normalized phone number"""
+    payload_json = TEXT_MESSAGE_JSON.format(text=dump_json(message))
+    return await send_serialized_message(
+        app_config, headers, settings.GUPSHUP_API_MSG_URL, "message", destination, payload_json, source_name
+    )
+
+async def dispatch_template_message(app_config: dict, headers: Dict[str, str], destination: str, template_id: str, template_params: List[str], source_name: str = None) -> Dict[str, Any]:
+    """Send a template message to an already normalized phone number"""
+    payload_json = dump_json({"id": template_id, "params": template_params})
+    return await send_serialized_message(
+        app_config, headers, settings.GUPSHUP_API_TEMPLATE_URL, "template", destination, payload_json, source_name
+    )
+
+async def dispatch_media_message(app_config: dict, headers: Dict[str, str], destination: str, media_type: str, media_url: str, caption: str = None, filename: str = None) -> Dict[str, Any]:
+    """Send a media message to an already normalized phone number"""
+    payload_json = dump_json(build_media_message(media_type, media_url, caption, filename))
+    return await send_serialized_message(
+        app_config, headers, settings.GUPSHUP_API_TEMPLATE_URL, "message", destination, payload_json
+    )
+
+def gupshup_json_response(
+    success: bool,
+    message: str,
+    data: Optional[Dict[str, Any]] = None,
+    gupshup_response: Optional[Dict[str, Any]] = None,
+    status_code: int = 200
+) -> JSONResponse:
+    """
+    Build a BaseGupshupResponse-shaped JSON response directly
+    
+    The send routes fill every field from values they produce themselves, so
+    they skip response-model validation and only document BaseGupshupResponse.
+    Fields left as None are omitted, matching response_model_exclude_none on
+    the other routes.
+    """
+    content = {"success": success, "message": message}
+    if data is not None:
+        content["data"] = data
+    if gupshup_response is not None:
+        content["gupshup_response"] = gupshup_response
+    return JSONResponse(status_code=status_code, content=content)
+
+def enqueue_gupshup_send(send) -> JSONResponse:
+    """
+    Queue a send for the background workers and answer 202 straight away
+    
+    Args:
+        send: Zero-argument coroutine function performing the Gupshup call
+        
+    Returns:
+        JSONResponse: 202 with the queued_id of the send
+        
+    Raises:
+        HTTPException: 429 if the send queue is full, 503 while shutting down
+    """
+    if gupshup_send_queue_closed.is_set():
+        raise HTTPException(
+            status_code=503,
+            detail="Server is shutting down, please retry later"
+        )
+    
+    queued_id = uuid4().hex
+    try:
+        gupshup_send_queue.put_nowait((queued_id, send))
+    except asyncio.QueueFull:
+        raise HTTPException(
+            status_code=429,
+            detail="Message queue is full, please retry later"
+        )
+    
+    return gupshup_json_response(
+        success=True,
+        message="Message queued for sending",
+        data={"queued_id": queued_id},
+        status_code=202
+    )
+
+GUPSHUP_MAX_RETRY_AFTER = 30.0
+
+# Failures where the request never reached Gupshup, so resending cannot duplicate a message
+GUPSHUP_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+def gupshup_backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the given number of retries already made"""
+    base_delay = settings.GUPSHUP_RETRY_BASE_DELAY
+    return base_delay * 2 ** attempt + random.uniform(0, base_delay)
+
+def gupshup_retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+    """
+    Work out how long to wait before retrying a Gupshup response
+    
+    Only 429 is retried. Sends are not idempotent and a 5xx can arrive after
+    Gupshup has already accepted the message, so those go back to the caller.
+    
+    Args:
+        response: Response from Gupshup
+        attempt: Number of retries already made
+        
+    Returns:
+        Seconds to sleep before the next attempt, or None if it should not be retried
+    """
+    if response.status_code != 429 or attempt >= settings.GUPSHUP_MAX_RETRIES:
+        return None
+    
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(float(retry_after), GUPSHUP_MAX_RETRY_AFTER)
+        except ValueError:
+            pass  # HTTP-date form, fall back to backoff
+    
+    return gupshup_backoff_delay(attempt)
+
+async def send_gupshup_request(api_url: str, form_body: str, headers: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Generic function to send requests to Gupshup API, retrying 429 responses and
+    connection failures with backoff
+    
+    Returns:
+        Dict with success, data and status_code; failures also carry an error message
+    """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                api_url,
-                headers=headers,
-                data=data,
-                timeout=30.0
+        attempt = 0
+        while True:
+            if attempt:
+                # Re-sends take a fresh token so a burst of 429s does not become a burst of retries
+                await gupshup_rate_limiter.acquire()
+            try:
+                async with gupshup_admission:
+                    response = await gupshup_client_for(api_url).post(
+                        api_url,
+                        headers=headers,
+                        content=form_body,
+                        timeout=30.0
+                    )
+            except GUPSHUP_UNSENT_ERRORS as e:
+                if attempt >= settings.GUPSHUP_MAX_RETRIES:
+                    raise
+                retry_delay = gupshup_backoff_delay(attempt)
+                attempt += 1
+                logger.warning(
+                    "Could not reach Gupshup at %s (%r), retry %s in %.2fs",
+                    api_url, e, attempt, retry_delay
+                )
+                await asyncio.sleep(retry_delay)
+                continue
+            
+            retry_delay = gupshup_retry_delay(response, attempt)
+            if retry_delay is None:
+                break
+            
+            attempt += 1
+            logger.warning(
+                "Gupshup returned %s for %s, retry %s in %.2fs",
+                response.status_code, api_url, attempt, retry_delay
             )
+            await asyncio.sleep(retry_delay)
             
-            # Gupshup API returns 202 for successful submissions
-            if response.status_code in [200, 202]:
+        # Gupshup API returns 202 for successful submissions
+        if response.status_code in [200, 202]:
+            # Only parse bodies labelled as JSON; plain-text acknowledgements are passed through
+            if "json" in response.headers.get("content-type", ""):
                 try:
-                    response_data = response.json()
-                    return {
-                        "success": True,
-                        "data": response_data if isinstance(response_data, dict) else {"response": str(response_data)},
-                        "status_code": response.status_code
-                    }
-                except json.JSONDecodeError:
-                    return {
-                        "success": True,
-                        "data": {"response": response.text},
-                        "status_code": response.status_code
-                    }
+                    response_data = orjson.loads(response.content)
+                except orjson.JSONDecodeError:
+                    response_data = {"response": response.text}
             else:
-                return {
-                    "success": False,
-                    "data": {"error": response.text},
-                    "status_code": response.status_code
-                }
+                response_data = {"response": response.text}
+            
+            return {
+                "success": True,
+                "data": response_data if isinstance(response_data, dict) else {"response": str(response_data)},
+                "status_code": response.status_code
+            }
+        else:
+            return {
+                "success": False,
+                "data": {"error": response.text},
+                "error": f"HTTP {response.status_code}: {response.text}",
+                "status_code": response.status_code
+            }
                 
     except Exception as e:
         return {
             "success": False,
             "data": {"error": str(e)},
+            "error": str(e),
             "status_code": 500
         }
 
+@lru_cache(maxsize=32)
 def validate_app_config(app_name: str) -> dict:
     """
     Validate and get app configuration
     
+    Results are cached per app name since the configuration is read from the
+    environment at startup; call validate_app_config.cache_clear() to reload it.
+    
     Args:
         app_name: Name of the app
         
     Returns:
-        Dict: App configuration
+        Dict: Read-only app configuration
         
     Raises:
         HTTPException: If app configuration is invalid
@@ -574,7 +770,7 @@ def validate_app_config(app_name: str) -> dict:
             detail=f"Source number not configured for app: {app_name}"
         )
     
-    return app_config
+    return MappingProxyType(app_config)
 
 
 # ==================== API ENDPOINTS ====================
@@ -585,8 +781,11 @@ class MessageRequest(BaseModel):
     message: dict = Field(..., description="Message data in Gupshup format")
     source_name: Optional[str] = Field(None, description="Custom source name")
 
-@router.post("/send-message", response_model=BaseGupshupResponse)
-async def send_message(request: MessageRequest):
+@router.post("/send-message", responses={200: {"model": BaseGupshupResponse}})
+async def send_message(
+    request: MessageRequest,
+    verbose: Annotated[bool, Query(description="Include the full Gupshup result in gupshup_response")] = False
+):
     """
     Send a message of any type via WhatsApp
     
@@ -594,6 +793,7 @@ async def send_message(request: MessageRequest):
     - **phone_number**: Phone number in any format (will be normalized)
     - **message**: Message data in Gupshup format
     - **source_name**: Optional custom source name
+    - **verbose** (query): Include the full Gupshup result in gupshup_response
     """
     # Get app-specific configuration
     app_config = validate_app_config(request.app_name)
@@ -601,28 +801,25 @@ async def send_message(request: MessageRequest):
     
     # message ={"type":"text", "text": request["message"]} 
     
-    data = {
-        'channel': 'whatsapp',
-        'source': app_config["source"],
-        'destination': request.phone_number,
-        'message': json.dumps(request.message)
-    }
-    
-    if request.source_name:
-        data['src.name'] = request.source_name
-
-    result = await send_gupshup_request(settings.GUPSHUP_API_MSG_URL, data, headers)
+    result = await send_serialized_message(
+        app_config, headers, settings.GUPSHUP_API_MSG_URL, "message",
+        request.phone_number, dump_json(request.message), request.source_name
+    )
     
-    return BaseGupshupResponse(
+    return gupshup_json_response(
         success=result["success"],
         message="Message sent successfully" if result["success"] else "Failed to send message",
         data=result["data"],
-        gupshup_response=result
+        gupshup_response=result if verbose else None
     )
 
 
-@router.post("/send-text", response_model=BaseGupshupResponse)
-async def send_text_message(request: TextMessageRequest):
+@router.post("/send-text", responses={200: {"model": BaseGupshupResponse}})
+async def send_text_message(
+    request: TextMessageRequest,
+    async_send: Annotated[bool, Query(alias="async", description="Queue the message and return 202 without waiting for Gupshup")] = False,
+    verbose: Annotated[bool, Query(description="Include the full Gupshup result in gupshup_response")] = False
+):
     """
     Send a simple text message via WhatsApp
     
@@ -630,30 +827,24 @@ async def send_text_message(request: TextMessageRequest):
     - **phone_number**: Phone number in any format (will be normalized)
     - **message**: Text message to send
     - **source_name**: Optional custom source name
+    - **async** (query): Queue the message and return 202 with a queued_id
+    - **verbose** (query): Include the full Gupshup result in gupshup_response
     """
-    # Get app-specific configuration
     app_config = validate_app_config(request.app_name)
-    headers = get_gupshup_headers(app_config)
-    
-    message ={"type":"text", "text": request.message} 
-    
-    data = {
-        'channel': 'whatsapp',
-        'source': app_config["source"],
-        'destination': request.phone_number,
-        'message': json.dumps(message)
-    }
+    send = partial(
+        dispatch_text_message,
+        app_config, get_gupshup_headers(app_config), request.phone_number, request.message, request.source_name
+    )
+    if async_send:
+        return enqueue_gupshup_send(send)
     
-    if request.source_name:
-        data['src.name'] = request.source_name
-
-    result = await send_gupshup_request(settings.GUPSHUP_API_MSG_URL, data, headers)
+    result = await send()
     
-    return BaseGupshupResponse(
+    return gupshup_json_response(
         success=result["success"],
         message="Text message sent successfully" if result["success"] else "Failed to send text message",
         data=result["data"],
-        gupshup_response=result
+        gupshup_response=result if verbose else None
     )
 
 
@@ -664,8 +855,12 @@ class DemoTemplateMessageRequest(BaseModel):
     template_params: List[str]
     source_name: Optional[str] = None
 
-@router.post("/send-template", response_model=BaseGupshupResponse)
-async def send_template_message(request: DemoTemplateMessageRequest):
+@router.post("/send-template", responses={200: {"model": BaseGupshupResponse}})
+async def send_template_message(
+    request: DemoTemplateMessageRequest,
+    async_send: Annotated[bool, Query(alias="async", description="Queue the message and return 202 without waiting for Gupshup")] = False,
+    verbose: Annotated[bool, Query(description="Include the full Gupshup result in gupshup_response")] = False
+):
     """
     Send a template message via WhatsApp
     
@@ -674,37 +869,33 @@ async def send_template_message(request: DemoTemplateMessageRequest):
     - **template_id**: Gupshup template ID
     - **template_params**: List of template parameters
     - **source_name**: Optional custom source name
+    - **async** (query): Queue the message and return 202 with a queued_id
+    - **verbose** (query): Include the full Gupshup result in gupshup_response
     """
-    # Get app-specific configuration
     app_config = validate_app_config(request.app_name)
-    headers = get_gupshup_headers(app_config)
-    
-    template_data = {
-        "id": request.template_id,
-        "params": request.template_params
-    }
-    
-    data = {
-        'channel': 'whatsapp',
-        'source': app_config["source"],
-        'destination': request.phone_number,
-        'template': json.dumps(template_data)
-    }
-    
-    if request.source_name:
-        data['src.name'] = request.source_name
+    send = partial(
+        dispatch_template_message,
+        app_config, get_gupshup_headers(app_config), request.phone_number,
+        request.template_id, request.template_params, request.source_name
+    )
+    if async_send:
+        return enqueue_gupshup_send(send)
     
-    result = await send_gupshup_request(settings.GUPSHUP_API_TEMPLATE_URL, data, headers)
+    result = await send()
     
-    return BaseGupshupResponse(
+    return gupshup_json_response(
         success=result["success"],
         message="Template message sent successfully" if result["success"] else "Failed to send template message",
         data=result["data"],
-        gupshup_response=result
+        gupshup_response=result if verbose else None
     )
 
-@router.post("/send-media", response_model=BaseGupshupResponse)
-async def send_media_message(request: MediaMessageRequest):
+@router.post("/send-media", responses={200: {"model": BaseGupshupResponse}})
+async def send_media_message(
+    request: MediaMessageRequest,
+    async_send: Annotated[bool, Query(alias="async", description="Queue the message and return 202 without waiting for Gupshup")] = False,
+    verbose: Annotated[bool, Query(description="Include the full Gupshup result in gupshup_response")] = False
+):
     """
     Send a media message (image, document, audio, video) via WhatsApp
     
@@ -714,41 +905,32 @@ async def send_media_message(request: MediaMessageRequest):
     - **media_url**: URL of the media file
     - **caption**: Optional caption for the media
     - **filename**: Optional filename for documents
+    - **async** (query): Queue the message and return 202 with a queued_id
+    - **verbose** (query): Include the full Gupshup result in gupshup_response
     """
-    # Get app-specific configuration
     app_config = validate_app_config(request.app_name)
-    headers = get_gupshup_headers(app_config)
-    
-    # Build media message structure
-    media_message = {
-        "type": request.media_type,
-        "url": request.media_url
-    }
-    
-    if request.caption:
-        media_message["caption"] = request.caption
-    
-    if request.filename and request.media_type == "document":
-        media_message["filename"] = request.filename
-    
-    data = {
-        'channel': 'whatsapp',
-        'source': app_config["source"],
-        'destination': request.phone_number,
-        'message': json.dumps(media_message)
-    }
+    send = partial(
+        dispatch_media_message,
+        app_config, get_gupshup_headers(app_config), request.phone_number,
+        request.media_type, request.media_url, request.caption, request.filename
+    )
+    if async_send:
+        return enqueue_gupshup_send(send)
     
-    result = await send_gupshup_request(settings.GUPSHUP_API_TEMPLATE_URL, data, headers)
+    result = await send()
     
-    return BaseGupshupResponse(
+    return gupshup_json_response(
         success=result["success"],
         message="Media message sent successfully" if result["success"] else "Failed to send media message",
         data=result["data"],
-        gupshup_response=result
+        gupshup_response=result if verbose else None
     )
 
-@router.post("/send-interactive", response_model=BaseGupshupResponse)
-async def send_interactive_message(request: InteractiveMessageRequest):
+@router.post("/send-interactive", responses={200: {"model": BaseGupshupResponse}})
+async def send_interactive_message(
+    request: InteractiveMessageRequest,
+    verbose: Annotated[bool, Query(description="Include the full Gupshup result in gupshup_response")] = False
+):
     """
     Send an interactive message (buttons, lists) via WhatsApp
     
@@ -759,6 +941,7 @@ async def send_interactive_message(request: InteractiveMessageRequest):
     - **body**: Message body content
     - **footer**: Optional message footer
     - **action**: Interactive action configuration
+    - **verbose** (query): Include the full Gupshup result in gupshup_response
     """
     # Get app-specific configuration
     app_config = validate_app_config(request.app_name)
@@ -779,24 +962,23 @@ async def send_interactive_message(request: InteractiveMessageRequest):
     if request.footer:
         interactive_message["interactive"]["footer"] = request.footer
     
-    data = {
-        'channel': 'whatsapp',
-        'source': app_config["source"],
-        'destination': request.phone_number,
-        'message': json.dumps(interactive_message)
-    }
-    
-    result = await send_gupshup_request(settings.GUPSHUP_API_TEMPLATE_URL, data, headers)
+    result = await send_serialized_message(
+        app_config, headers, settings.GUPSHUP_API_TEMPLATE_URL, "message",
+        request.phone_number, dump_json(interactive_message)
+    )
     
-    return BaseGupshupResponse(
+    return gupshup_json_response(
         success=result["success"],
         message="Interactive message sent successfully" if result["success"] else "Failed to send interactive message",
         data=result["data"],
-        gupshup_response=result
+        gupshup_response=result if verbose else None
     )
 
-@router.post("/send-location", response_model=BaseGupshupResponse)
-async def send_location_message(request: LocationMessageRequest):
+@router.post("/send-location", responses={200: {"model": BaseGupshupResponse}})
+async def send_location_message(
+    request: LocationMessageRequest,
+    verbose: Annotated[bool, Query(description="Include the full Gupshup result in gupshup_response")] = False
+):
     """
     Send a location message via WhatsApp
     
@@ -806,6 +988,7 @@ async def send_location_message(request: LocationMessageRequest):
     - **longitude**: Longitude coordinate
     - **name**: Optional location name
     - **address**: Optional location address
+    - **verbose** (query): Include the full Gupshup result in gupshup_response
     """
     # Get app-specific configuration
     app_config = validate_app_config(request.app_name)
@@ -825,30 +1008,30 @@ async def send_location_message(request: LocationMessageRequest):
     if request.address:
         location_message["location"]["address"] = request.address
     
-    data = {
-        'channel': 'whatsapp',
-        'source': app_config["source"],
-        'destination': request.phone_number,
-        'message': json.dumps(location_message)
-    }
-    
-    result = await send_gupshup_request(settings.GUPSHUP_API_TEMPLATE_URL, data, headers)
+    result = await send_serialized_message(
+        app_config, headers, settings.GUPSHUP_API_TEMPLATE_URL, "message",
+        request.phone_number, dump_json(location_message)
+    )
     
-    return BaseGupshupResponse(
+    return gupshup_json_response(
         success=result["success"],
         message="Location message sent successfully" if result["success"] else "Failed to send location message",
         data=result["data"],
-        gupshup_response=result
+        gupshup_response=result if verbose else None
     )
 
-@router.post("/send-contact", response_model=BaseGupshupResponse)
-async def send_contact_message(request: ContactMessageRequest):
+@router.post("/send-contact", responses={200: {"model": BaseGupshupResponse}})
+async def send_contact_message(
+    request: ContactMessageRequest,
+    verbose: Annotated[bool, Query(description="Include the full Gupshup result in gupshup_response")] = False
+):
     """
     Send a contact message via WhatsApp
     
     - **app_name**: Gupshup app name (e.g., 'homi', 'orbit')
     - **phone_number**: Phone number in any format (will be normalized)
     - **contacts**: List of contact objects
+    - **verbose** (query): Include the full Gupshup result in gupshup_response
     """
     # Get app-specific configuration
     app_config = validate_app_config(request.app_name)
@@ -859,23 +1042,120 @@ async def send_contact_message(request: ContactMessageRequest):
         "contacts": request.contacts
     }
     
-    data = {
-        'channel': 'whatsapp',
-        'source': app_config["source"],
-        'destination': request.phone_number,
-        'message': json.dumps(contact_message)
-    }
-    
-    result = await send_gupshup_request(settings.GUPSHUP_API_TEMPLATE_URL, data, headers)
+    result = await send_serialized_message(
+        app_config, headers, settings.GUPSHUP_API_TEMPLATE_URL, "message",
+        request.phone_number, dump_json(contact_message)
+    )
     
-    return BaseGupshupResponse(
+    return gupshup_json_response(
         success=result["success"],
         message="Contact message sent successfully" if result["success"] else "Failed to send contact message",
         data=result["data"],
-        gupshup_response=result
+        gupshup_response=result if verbose else None
     )
 
-@router.post("/send-bulk", response_model=BaseGupshupResponse)
+def unique_phone_numbers(phone_numbers: List[str]) -> List[str]:
+    """Normalize each phone number once and drop repeats, keeping first-seen order"""
+    return list(dict.fromkeys(normalize_phone_number(phone_number) for phone_number in phone_numbers))
+
+def build_bulk_text_payload(content: TextContent):
+    """Return (api_url, payload_field, payload_json) for a bulk text message"""
+    payload_json = TEXT_MESSAGE_JSON.format(text=dump_json(content.message))
+    return settings.GUPSHUP_API_MSG_URL, "message", payload_json
+
+def build_bulk_template_payload(content: TemplateContent):
+    """Return (api_url, payload_field, payload_json) for a bulk template message"""
+    payload_json = dump_json({
+        "id": content.template_id,
+        "params": content.template_params
+    })
+    return settings.GUPSHUP_API_TEMPLATE_URL, "template", payload_json
+
+def build_bulk_media_payload(content: MediaContent):
+    """Return (api_url, payload_field, payload_json) for a bulk media message"""
+    payload_json = dump_json(build_media_message(
+        content.media_type,
+        content.media_url,
+        content.caption,
+        content.filename
+    ))
+    return settings.GUPSHUP_API_TEMPLATE_URL, "message", payload_json
+
+# message_type -> (message_data adapter, payload builder, success message, failure message)
+BULK_MESSAGE_BUILDERS = {
+    "text": (TypeAdapter(TextContent), build_bulk_text_payload, "Text message sent successfully", "Failed to send text message"),
+    "template": (TypeAdapter(TemplateContent), build_bulk_template_payload, "Template message sent successfully", "Failed to send template message"),
+    "media": (TypeAdapter(MediaContent), build_bulk_media_payload, "Media message sent successfully", "Failed to send media message"),
+}
+
+def prepare_bulk_sender(request: BulkMessageRequest):
+    """
+    Validate a bulk request and build the per-recipient send coroutine function
+    
+    The payload is serialized once and every call shares the batch's concurrency
+    and rate limits.
+    
+    Args:
+        request: Bulk message request
+        
+    Returns:
+        Coroutine function taking a normalized phone number and returning its result dict
+        
+    Raises:
+        HTTPException: 422 if message_data does not fit message_type, or if app configuration is invalid (400)
+    """
+    data_adapter, build_payload, success_message, failure_message = BULK_MESSAGE_BUILDERS[request.message_type]
+    try:
+        message_data = data_adapter.validate_python(request.message_data)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=422,
+            detail=[
+                {**error, "loc": ("body", "message_data", *error["loc"])}
+                for error in e.errors(include_url=False, include_context=False)
+            ]
+        )
+
+    app_config = validate_app_config(request.app_name)
+    headers = get_gupshup_headers(app_config)
+
+    # The payload is the same for every recipient, so serialize and URL-encode it once up front
+    api_url, payload_field, payload_json = build_payload(message_data)
+    encoded_payload = encode_form_field(payload_field, payload_json)
+
+    semaphore = asyncio.Semaphore(request.max_concurrency or 1)
+
+    # Every send takes an app-wide token; a per-batch pace can only slow the batch further
+    if request.max_rate:
+        batch_rate_limiter = AsyncLimiter(request.max_rate, 1)
+    elif request.delay_between_messages and request.delay_between_messages > 0:
+        batch_rate_limiter = AsyncLimiter(1, request.delay_between_messages)
+    else:
+        batch_rate_limiter = nullcontext()
+
+    async def send_one(phone_number: str) -> Dict[str, Any]:
+        async with semaphore, batch_rate_limiter, gupshup_rate_limiter:
+            try:
+                result = await send_encoded_message(
+                    app_config, headers, api_url, phone_number, encoded_payload
+                )
+
+                return {
+                    "phone_number": phone_number,
+                    "success": result["success"],
+                    "message": success_message if result["success"] else failure_message
+                }
+                    
+            except Exception as e:
+                return {
+                    "phone_number": phone_number,
+                    "success": False,
+                    "message": f"Error: {str(e)}"
+                }
+
+    return send_one
+
+@router.post("/send-bulk", responses={200: {"model": BaseGupshupResponse}})
 async def send_bulk_messages(request: BulkMessageRequest):
     """
     Send bulk messages to multiple phone numbers
@@ -884,86 +1164,147 @@ async def send_bulk_messages(request: BulkMessageRequest):
     - **phone_numbers**: List of phone numbers
     - **message_type**: Type of message (text, template, media)
     - **message_data**: Message data based on type
-    - **delay_between_messages**: Delay in seconds between messages
-    """
-    import asyncio
+    - **delay_between_messages**: Deprecated, minimum seconds between messages
+    - **max_rate**: Optional messages per second for this batch
+    - **max_concurrency**: Maximum number of messages in flight
     
-    results = []
-    successful_sends = 0
-    failed_sends = 0
-    
-    for phone_number in request.phone_numbers:
-        try:
-            # Normalize phone number
-            normalized_phone = normalize_phone_number(phone_number)
-            
-            # Prepare message data based on type
-            if request.message_type == "text":
-                message_request = TextMessageRequest(
-                    app_name=request.app_name,
-                    phone_number=normalized_phone,
-                    message=request.message_data.get("message", "")
-                )
-                result = await send_text_message(message_request)
-            elif request.message_type == "template":
-                message_request = TemplateMessageRequest(
-                    app_name=request.app_name,
-                    phone_number=normalized_phone,
-                    template_id=request.message_data.get("template_id", ""),
-                    template_params=request.message_data.get("template_params", [])
-                )
-                result = await send_template_message(message_request)
-            elif request.message_type == "media":
-                message_request = MediaMessageRequest(
-                    app_name=request.app_name,
-                    phone_number=normalized_phone,
-                    media_type=request.message_data.get("media_type", ""),
-                    media_url=request.message_data.get("media_url", ""),
-                    caption=request.message_data.get("caption"),
-                    filename=request.message_data.get("filename")
-                )
-                result = await send_media_message(message_request)
-            else:
-                result = BaseGupshupResponse(
-                    success=False,
-                    message=f"Unsupported message type: {request.message_type}"
-                )
-            
-            results.append({
-                "phone_number": normalized_phone,
-                "success": result.success,
-                "message": result.message
-            })
-            
-            if result.success:
-                successful_sends += 1
-            else:
-                failed_sends += 1
-            
-            # Add delay between messages
-            if request.delay_between_messages and request.delay_between_messages > 0:
-                await asyncio.sleep(request.delay_between_messages)
-                
-        except Exception as e:
-            results.append({
-                "phone_number": phone_number,
-                "success": False,
-                "message": f"Error: {str(e)}"
-            })
-            failed_sends += 1
+    Numbers are normalized and duplicates sent once; the count skipped is
+    returned as duplicates_dropped.
+    """
+    send_one = prepare_bulk_sender(request)
+    phone_numbers = unique_phone_numbers(request.phone_numbers)
+
+    # Results come back in first-seen order of the deduplicated numbers
+    results = await asyncio.gather(*(send_one(phone_number) for phone_number in phone_numbers))
+    successful_sends = sum(1 for result in results if result["success"])
+    failed_sends = len(results) - successful_sends
     
-    return BaseGupshupResponse(
+    return gupshup_json_response(
         success=successful_sends > 0,
         message=f"Bulk messaging completed. Success: {successful_sends}, Failed: {failed_sends}",
         data={
-            "total_sent": len(request.phone_numbers),
+            "total_sent": len(phone_numbers),
+            "duplicates_dropped": len(request.phone_numbers) - len(phone_numbers),
             "successful": successful_sends,
             "failed": failed_sends,
             "results": results
         }
     )
 
-@router.get("/message-status/{message_id}", response_model=BaseGupshupResponse)
+@router.post("/send-bulk-stream")
+async def send_bulk_messages_stream(request: BulkMessageRequest):
+    """
+    Send bulk messages and stream each result as a Server-Sent Event
+    
+    Takes the same body as /send-bulk. Every finished send is emitted as a
+    `data:` event in completion order, followed by a final `event: summary`
+    with the totals, so results are never buffered for the whole batch.
+    """
+    send_one = prepare_bulk_sender(request)
+    phone_numbers = unique_phone_numbers(request.phone_numbers)
+
+    async def stream_results():
+        successful_sends = 0
+        failed_sends = 0
+        tasks = [asyncio.create_task(send_one(phone_number)) for phone_number in phone_numbers]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                if result["success"]:
+                    successful_sends += 1
+                else:
+                    failed_sends += 1
+                yield f"data: {dump_json(result)}\n\n"
+
+            summary = {
+                "total_sent": len(phone_numbers),
+                "duplicates_dropped": len(request.phone_numbers) - len(phone_numbers),
+                "successful": successful_sends,
+                "failed": failed_sends
+            }
+            yield f"event: summary\ndata: {dump_json(summary)}\n\n"
+        finally:
+            # Stop pending sends if the client disconnects mid-stream
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(stream_results(), media_type="text/event-stream")
+
+class BatchSendItem(BaseModel):
+    id: str = Field(..., description="Client-chosen identifier echoed back with the result")
+    path: Literal["/send-text", "/send-template", "/send-media"] = Field(..., description="Send endpoint to run")
+    body: Dict[str, Any] = Field(..., description="Request body for that endpoint")
+
+class BatchSendRequest(BaseModel):
+    requests: List[BatchSendItem] = Field(..., min_length=1, max_length=100, description="Sends to run in one round-trip")
+
+# path -> (request model, send coroutine builder, success message, failure message)
+BATCH_SEND_ROUTES = {
+    "/send-text": (
+        TextMessageRequest,
+        lambda app_config, headers, request: dispatch_text_message(
+            app_config, headers, request.phone_number, request.message, request.source_name
+        ),
+        "Text message sent successfully", "Failed to send text message"
+    ),
+    "/send-template": (
+        DemoTemplateMessageRequest,
+        lambda app_config, headers, request: dispatch_template_message(
+            app_config, headers, request.phone_number, request.template_id, request.template_params, request.source_name
+        ),
+        "Template message sent successfully", "Failed to send template message"
+    ),
+    "/send-media": (
+        MediaMessageRequest,
+        lambda app_config, headers, request: dispatch_media_message(
+            app_config, headers, request.phone_number, request.media_type,
+            request.media_url, request.caption, request.filename
+        ),
+        "Media message sent successfully", "Failed to send media message"
+    ),
+}
+
+async def run_batch_item(item: BatchSendItem) -> Dict[str, Any]:
+    """Validate and send one /batch entry, returning {id, status, body} like a standalone call"""
+    request_model, build_send, success_message, failure_message = BATCH_SEND_ROUTES[item.path]
+    try:
+        request = request_model.model_validate(item.body)
+        app_config = validate_app_config(request.app_name)
+    except ValidationError as e:
+        return {"id": item.id, "status": 422, "body": {"detail": e.errors(include_url=False, include_context=False)}}
+    except HTTPException as e:
+        return {"id": item.id, "status": e.status_code, "body": {"detail": e.detail}}
+
+    async with gupshup_rate_limiter:
+        result = await build_send(app_config, get_gupshup_headers(app_config), request)
+
+    return {
+        "id": item.id,
+        "status": 200,
+        "body": {
+            "success": result["success"],
+            "message": success_message if result["success"] else failure_message,
+            "data": result["data"]
+        }
+    }
+
+@router.post("/batch")
+async def send_batch(request: BatchSendRequest):
+    """
+    Run several send requests in one HTTP round-trip
+    
+    - **requests**: Up to 100 entries of {id, path, body}, where path is
+      /send-text, /send-template or /send-media and body is that endpoint's
+      request body
+    
+    Entries run concurrently under the app-wide Gupshup rate limit. Each result
+    is {id, status, body} with the status and body the standalone endpoint would
+    have returned, in request order.
+    """
+    results = await asyncio.gather(*(run_batch_item(item) for item in request.requests))
+    return {"results": results}
+
+@router.get("/message-status/{message_id}", response_model=BaseGupshupResponse, response_model_exclude_none=True)
 async def get_message_status(message_id: str):
     """
     Get the status of a sent message
@@ -972,7 +1313,7 @@ async def get_message_status(message_id: str):
     """
     # Note: This endpoint would require Gupshup's status API
     # For now, returning a placeholder response
-    return BaseGupshupResponse(
+    return BaseGupshupResponse.model_construct(
         success=True,
         message="Message status retrieved successfully",
         data={
@@ -983,10 +1324,12 @@ async def get_message_status(message_id: str):
     )
 
 
-@router.get("/templates/by-app", response_model=BaseGupshupResponse)
+@router.get("/templates/by-app", response_model=BaseGupshupResponse, response_model_exclude_none=True)
 async def get_templates_by_app_name(
+    response: Response,
     app_name: str, 
-    template_status: Optional[str] = None
+    template_status: Optional[str] = None,
+    refresh: bool = False
 ):
     """
     Get WhatsApp templates for a specific Gupshup app from Gupshup API
@@ -997,9 +1340,47 @@ async def get_templates_by_app_name(
     Query Parameters:
     - app_name: Name of the Gupshup app (e.g., 'basichomeloan', 'irabybasic')
     - template_status: Filter templates by status (default: None)
+    - refresh: Skip the cache and refetch from Gupshup (default: false)
     
     Example: /api_v1/gupshup/templates/by-app?app_name=basichomeloan&template_status=APPROVED
-    """
+    
+    Responses are cached for 10 minutes; the X-Cache header reports HIT or MISS.
+    """
+    cache_key = (app_name, template_status or "ALL")
+    cached_response = None if refresh else templates_cache.get(cache_key)
+    if cached_response is not None:
+        response.headers["X-Cache"] = "HIT"
+        return cached_response
+    
+    # Single-flight: concurrent misses wait for the first fetch instead of all hitting Gupshup
+    lock = templates_cache_locks.setdefault(cache_key, asyncio.Lock())
+    async with lock:
+        cached_response = None if refresh else templates_cache.get(cache_key)
+        if cached_response is not None:
+            response.headers["X-Cache"] = "HIT"
+            return cached_response
+        
+        templates_response = await fetch_templates_by_app_name(app_name, template_status)
+        templates_cache[cache_key] = templates_response
+    
+    response.headers["X-Cache"] = "MISS"
+    return templates_response
+
+def extract_templates(templates_data: Any) -> List[Any]:
+    """Pull the template list out of the different Gupshup response shapes"""
+    if isinstance(templates_data, list):
+        return templates_data
+    if isinstance(templates_data, dict):
+        # Handle different possible response structures
+        if "templates" in templates_data:
+            return templates_data["templates"]
+        if "data" in templates_data:
+            return templates_data["data"]
+        return [templates_data]  # Single template response
+    return []
+
+async def fetch_templates_by_app_name(app_name: str, template_status: Optional[str] = None) -> BaseGupshupResponse:
+    """Fetch and normalize templates for an app from Gupshup, bypassing the cache"""
     try:
         # Get app-specific configuration
         app_config = validate_app_config(app_name)
@@ -1019,21 +1400,9 @@ async def get_templates_by_app_name(
         
         if result["success"]:
             templates_data = result["data"]
+            templates = extract_templates(templates_data)
             
-            # Extract templates from Gupshup response
-            templates = []
-            if isinstance(templates_data, dict):
-                # Handle different possible response structures
-                if "templates" in templates_data:
-                    templates = templates_data["templates"]
-                elif "data" in templates_data:
-                    templates = templates_data["data"]
-                else:
-                    templates = [templates_data]  # Single template response
-            elif isinstance(templates_data, list):
-                templates = templates_data
-            
-            return BaseGupshupResponse(
+            return BaseGupshupResponse.model_construct(
                 success=True,
                 message=f"Found {len(templates)} templates for app: {app_name}",
                 data={
@@ -1042,8 +1411,7 @@ async def get_templates_by_app_name(
                     "template_status": template_status,
                     "templates": templates,
                     "total_count": len(templates)
-                },
-                gupshup_response=templates_data
+                }
             )
         else:
             raise HTTPException(
@@ -1059,6 +1427,47 @@ async def get_templates_by_app_name(
             detail=f"Error fetching templates for app {app_name}: {str(e)}"
         )
 
+def build_available_apps() -> List[Dict[str, Any]]:
+    """Build the list of configured Gupshup apps served by /apps"""
+    apps_list = []
+    for app_name, config in settings.GUPSHUP_APPS.items():
+        apps_list.append({
+            "app_name": app_name,
+            "app_id": config["app_id"],
+            "source": config["source"],
+            "has_api_key": bool(config["api_key"]),
+            "status": "configured"
+        })
+    
+    # Add default app if configured
+    if settings.GUPSHUP_API_KEY:
+        apps_list.append({
+            "app_name": "default",
+            "app_id": "N/A",
+            "source": settings.GUPSHUP_SOURCE,
+            "has_api_key": True,
+            "status": "configured"
+        })
+    
+    return apps_list
+
+def build_available_apps_response() -> AppListResponse:
+    """Build the complete /apps response from the configured Gupshup apps"""
+    apps_list = build_available_apps()
+    return AppListResponse(
+        success=True,
+        message=f"Found {len(apps_list)} configured apps",
+        apps=apps_list
+    )
+
+# App configuration only changes on /apps/reload-config, so build the response once
+available_apps_response = build_available_apps_response()
+
+def refresh_available_apps():
+    """Rebuild the cached /apps response from the current environment"""
+    global available_apps_response
+    available_apps_response = build_available_apps_response()
+
 @router.get("/apps", response_model=AppListResponse)
 async def get_available_apps():
     """
@@ -1066,40 +1475,67 @@ async def get_available_apps():
     
     Returns all apps that have been configured with API keys and app IDs.
     """
-    try:
-        apps_config = settings.GUPSHUP_APPS
-        
-        apps_list = []
-        for app_name, config in apps_config.items():
-            apps_list.append({
-                "app_name": app_name,
-                "app_id": config["app_id"],
-                "source": config["source"],
-                "has_api_key": bool(config["api_key"]),
-                "status": "configured"
-            })
-        
-        # Add default app if configured
-        if settings.GUPSHUP_API_KEY:
-            apps_list.append({
-                "app_name": "default",
-                "app_id": "N/A",
-                "source": settings.GUPSHUP_SOURCE,
-                "has_api_key": True,
-                "status": "configured"
-            })
-        
-        return AppListResponse(
-            success=True,
-            message=f"Found {len(apps_list)} configured apps",
-            apps=apps_list
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error retrieving app configurations: {str(e)}"
-        )
+    return available_apps_response
+
+@router.post("/apps/reload-config", response_model=BaseGupshupResponse, response_model_exclude_none=True)
+async def reload_app_config():
+    """
+    Drop cached Gupshup app configurations, headers and template listings
+    and rebuild the /apps listing
+    
+    Use after changing app credentials in the environment or templates in
+    Gupshup so the next request re-reads them.
+    """
+    validate_app_config.cache_clear()
+    _gupshup_headers_for_key.cache_clear()
+    templates_cache.clear()
+    refresh_available_apps()
+    
+    return BaseGupshupResponse.model_construct(
+        success=True,
+        message="Gupshup app configuration and template caches cleared"
+    )
+
+@router.post("/templates/invalidate", response_model=BaseGupshupResponse, response_model_exclude_none=True)
+async def invalidate_templates_cache(app_name: Optional[str] = None):
+    """
+    Drop cached template listings so the next /templates/by-app call refetches from Gupshup
+
+    Query Parameters:
+    - app_name: Only drop listings for this app (default: all apps)
+    """
+    if app_name is None:
+        removed = len(templates_cache)
+        templates_cache.clear()
+    else:
+        keys = [key for key in list(templates_cache.keys()) if key[0] == app_name]
+        for key in keys:
+            templates_cache.pop(key, None)
+        removed = len(keys)
+
+    return BaseGupshupResponse.model_construct(
+        success=True,
+        message=f"Cleared {removed} cached template listing(s)",
+        data={"app_name": app_name, "removed": removed}
+    )
+
+@router.post("/admission", response_model=BaseGupshupResponse, response_model_exclude_none=True)
+async def set_gupshup_admission(max_in_flight: int = Query(..., ge=1, description="Maximum Gupshup requests in flight")):
+    """
+    Change the cap on concurrent Gupshup API requests without a restart
+    
+    Requests already waiting for a slot are re-checked against the new limit.
+    """
+    await gupshup_admission.set_max_in_flight(max_in_flight)
+    
+    return BaseGupshupResponse.model_construct(
+        success=True,
+        message=f"Gupshup max in-flight requests set to {max_in_flight}",
+        data={
+            "max_in_flight": gupshup_admission.max_in_flight,
+            "in_flight": gupshup_admission.in_flight
+        }
+    )
 
 # @router.get("/health")
 # async def gupshup_health_check():
@@ -1197,7 +1633,7 @@ async def get_available_apps():
 
 # ==================== SESSION MESSAGE ENDPOINTS ====================
 
-@router.post("/session/text", response_model=SessionMessageResponse)
+@router.post("/session/text", response_model=SessionMessageResponse, response_model_exclude_none=True)
 async def send_session_text_message(request: SessionTextMessageRequest):
     """
     Send a session-bound text message via WhatsApp
@@ -1221,7 +1657,7 @@ async def send_session_text_message(request: SessionTextMessageRequest):
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return SessionMessageResponse(
+            return SessionMessageResponse.model_construct(
                 success=True,
                 message="Text message sent successfully",
                 message_id=message_id,
@@ -1242,7 +1678,7 @@ async def send_session_text_message(request: SessionTextMessageRequest):
             detail=f"Error sending text message: {str(e)}"
         )
 
-@router.post("/session/image", response_model=SessionMessageResponse)
+@router.post("/session/image", response_model=SessionMessageResponse, response_model_exclude_none=True)
 async def send_session_image_message(request: SessionImageMessageRequest):
     """
     Send a session-bound image message via WhatsApp
@@ -1269,7 +1705,7 @@ async def send_session_image_message(request: SessionImageMessageRequest):
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return SessionMessageResponse(
+            return SessionMessageResponse.model_construct(
                 success=True,
                 message="Image message sent successfully",
                 message_id=message_id,
@@ -1294,7 +1730,7 @@ async def send_session_image_message(request: SessionImageMessageRequest):
             detail=f"Error sending image message: {str(e)}"
         )
 
-@router.post("/session/document", response_model=SessionMessageResponse)
+@router.post("/session/document", response_model=SessionMessageResponse, response_model_exclude_none=True)
 async def send_session_document_message(request: SessionDocumentMessageRequest):
     """
     Send a session-bound document message via WhatsApp
@@ -1322,7 +1758,7 @@ async def send_session_document_message(request: SessionDocumentMessageRequest):
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return SessionMessageResponse(
+            return SessionMessageResponse.model_construct(
                 success=True,
                 message="Document message sent successfully",
                 message_id=message_id,
@@ -1348,7 +1784,7 @@ async def send_session_document_message(request: SessionDocumentMessageRequest):
             detail=f"Error sending document message: {str(e)}"
         )
 
-@router.post("/session/audio", response_model=SessionMessageResponse)
+@router.post("/session/audio", response_model=SessionMessageResponse, response_model_exclude_none=True)
 async def send_session_audio_message(request: SessionAudioMessageRequest):
     """
     Send a session-bound audio message via WhatsApp
@@ -1372,7 +1808,7 @@ async def send_session_audio_message(request: SessionAudioMessageRequest):
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return SessionMessageResponse(
+            return SessionMessageResponse.model_construct(
                 success=True,
                 message="Audio message sent successfully",
                 message_id=message_id,
@@ -1396,7 +1832,7 @@ async def send_session_audio_message(request: SessionAudioMessageRequest):
             detail=f"Error sending audio message: {str(e)}"
         )
 
-@router.post("/session/video", response_model=SessionMessageResponse)
+@router.post("/session/video", response_model=SessionMessageResponse, response_model_exclude_none=True)
 async def send_session_video_message(request: SessionVideoMessageRequest):
     """
     Send a session-bound video message via WhatsApp
@@ -1423,7 +1859,7 @@ async def send_session_video_message(request: SessionVideoMessageRequest):
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return SessionMessageResponse(
+            return SessionMessageResponse.model_construct(
                 success=True,
                 message="Video message sent successfully",
                 message_id=message_id,
@@ -1448,7 +1884,7 @@ async def send_session_video_message(request: SessionVideoMessageRequest):
             detail=f"Error sending video message: {str(e)}"
         )
 
-@router.post("/session/sticker", response_model=SessionMessageResponse)
+@router.post("/session/sticker", response_model=SessionMessageResponse, response_model_exclude_none=True)
 async def send_session_sticker_message(request: SessionStickerMessageRequest):
     """
     Send a session-bound sticker message via WhatsApp
@@ -1472,7 +1908,7 @@ async def send_session_sticker_message(request: SessionStickerMessageRequest):
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return SessionMessageResponse(
+            return SessionMessageResponse.model_construct(
                 success=True,
                 message="Sticker message sent successfully",
                 message_id=message_id,
@@ -1496,7 +1932,7 @@ async def send_session_sticker_message(request: SessionStickerMessageRequest):
             detail=f"Error sending sticker message: {str(e)}"
         )
 
-@router.post("/session/reaction", response_model=SessionMessageResponse)
+@router.post("/session/reaction", response_model=SessionMessageResponse, response_model_exclude_none=True)
 async def send_session_reaction_message(request: SessionReactionMessageRequest):
     """
     Send a session-bound reaction message via WhatsApp
@@ -1521,7 +1957,7 @@ async def send_session_reaction_message(request: SessionReactionMessageRequest):
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return SessionMessageResponse(
+            return SessionMessageResponse.model_construct(
                 success=True,
                 message="Reaction sent successfully",
                 message_id=message_id,
@@ -1546,7 +1982,7 @@ async def send_session_reaction_message(request: SessionReactionMessageRequest):
             detail=f"Error sending reaction: {str(e)}"
         )
 
-@router.post("/session/location", response_model=SessionMessageResponse)
+@router.post("/session/location", response_model=SessionMessageResponse, response_model_exclude_none=True)
 async def send_session_location_message(request: SessionLocationMessageRequest):
     """
     Send a session-bound location message via WhatsApp
@@ -1577,7 +2013,7 @@ async def send_session_location_message(request: SessionLocationMessageRequest):
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return SessionMessageResponse(
+            return SessionMessageResponse.model_construct(
                 success=True,
                 message="Location message sent successfully",
                 message_id=message_id,
@@ -1604,7 +2040,7 @@ async def send_session_location_message(request: SessionLocationMessageRequest):
             detail=f"Error sending location message: {str(e)}"
         )
 
-@router.post("/session/list", response_model=SessionMessageResponse)
+@router.post("/session/list", response_model=SessionMessageResponse, response_model_exclude_none=True)
 async def send_session_list_message(request: SessionListMessageRequest):
     """
     Send a session-bound list message via WhatsApp
@@ -1649,7 +2085,7 @@ async def send_session_list_message(request: SessionListMessageRequest):
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return SessionMessageResponse(
+            return SessionMessageResponse.model_construct(
                 success=True,
                 message="List message sent successfully",
                 message_id=message_id,
@@ -1677,7 +2113,7 @@ async def send_session_list_message(request: SessionListMessageRequest):
             detail=f"Error sending list message: {str(e)}"
         )
 
-@router.post("/session/quick-replies", response_model=SessionMessageResponse)
+@router.post("/session/quick-replies", response_model=SessionMessageResponse, response_model_exclude_none=True)
 async def send_session_quick_replies_message(request: SessionQuickRepliesRequest):
     """
     Send a session-bound quick replies message via WhatsApp
@@ -1727,7 +2163,7 @@ async def send_session_quick_replies_message(request: SessionQuickRepliesRequest
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return SessionMessageResponse(
+            return SessionMessageResponse.model_construct(
                 success=True,
                 message="Quick replies message sent successfully",
                 message_id=message_id,
@@ -1754,7 +2190,7 @@ async def send_session_quick_replies_message(request: SessionQuickRepliesRequest
             detail=f"Error sending quick replies message: {str(e)}"
         )
 
-@router.post("/session/catalog", response_model=SessionMessageResponse)
+@router.post("/session/catalog", response_model=SessionMessageResponse, response_model_exclude_none=True)
 async def send_session_catalog_message(request: SessionCatalogMessageRequest):
     """
     Send a session-bound catalog message via WhatsApp
@@ -1790,7 +2226,7 @@ async def send_session_catalog_message(request: SessionCatalogMessageRequest):
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return SessionMessageResponse(
+            return SessionMessageResponse.model_construct(
                 success=True,
                 message="Catalog message sent successfully",
                 message_id=message_id,
@@ -1817,7 +2253,7 @@ async def send_session_catalog_message(request: SessionCatalogMessageRequest):
             detail=f"Error sending catalog message: {str(e)}"
         )
 
-@router.post("/session/single-product", response_model=SessionMessageResponse)
+@router.post("/session/single-product", response_model=SessionMessageResponse, response_model_exclude_none=True)
 async def send_session_single_product_message(request: SessionSingleProductRequest):
     """
     Send a session-bound single product message via WhatsApp
@@ -1856,7 +2292,7 @@ async def send_session_single_product_message(request: SessionSingleProductReque
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return SessionMessageResponse(
+            return SessionMessageResponse.model_construct(
                 success=True,
                 message="Single product message sent successfully",
                 message_id=message_id,
@@ -1883,7 +2319,7 @@ async def send_session_single_product_message(request: SessionSingleProductReque
             detail=f"Error sending single product message: {str(e)}"
         )
 
-@router.post("/session/multi-product", response_model=SessionMessageResponse)
+@router.post("/session/multi-product", response_model=SessionMessageResponse, response_model_exclude_none=True)
 async def send_session_multi_product_message(request: SessionMultiProductRequest):
     """
     Send a session-bound multi product message via WhatsApp
@@ -1922,7 +2358,7 @@ async def send_session_multi_product_message(request: SessionMultiProductRequest
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return SessionMessageResponse(
+            return SessionMessageResponse.model_construct(
                 success=True,
                 message="Multi product message sent successfully",
                 message_id=message_id,
@@ -1950,7 +2386,7 @@ async def send_session_multi_product_message(request: SessionMultiProductRequest
             detail=f"Error sending multi product message: {str(e)}"
         )
 
-@router.post("/session/cta", response_model=SessionMessageResponse)
+@router.post("/session/cta", response_model=SessionMessageResponse, response_model_exclude_none=True)
 async def send_session_cta_message(request: SessionCTAMessageRequest):
     """
     Send a session-bound CTA (Call-to-Action) message via WhatsApp
@@ -2008,7 +2444,7 @@ async def send_session_cta_message(request: SessionCTAMessageRequest):
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return SessionMessageResponse(
+            return SessionMessageResponse.model_construct(
                 success=True,
                 message="CTA message sent successfully",
                 message_id=message_id,
@@ -2037,7 +2473,7 @@ async def send_session_cta_message(request: SessionCTAMessageRequest):
 
 # ==================== TEMPLATE MESSAGE ENDPOINTS ====================
 
-@router.post("/template/text", response_model=TemplateMessageResponse)
+@router.post("/template/text", response_model=TemplateMessageResponse, response_model_exclude_none=True)
 async def send_template_text_message(request: TemplateTextMessageRequest):
     """
     Send a template-based text message via WhatsApp
@@ -2047,7 +2483,7 @@ async def send_template_text_message(request: TemplateTextMessageRequest):
     try:
         app_config = validate_app_config(request.app_name)
         
-        result = await send_template_message(
+        result = await send_gupshup_template_message(
             app_config, 
             request.phone_number, 
             request.template_id, 
@@ -2060,7 +2496,7 @@ async def send_template_text_message(request: TemplateTextMessageRequest):
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return TemplateMessageResponse(
+            return TemplateMessageResponse.model_construct(
                 success=True,
                 message="Template text message sent successfully",
                 message_id=message_id,
@@ -2086,7 +2522,7 @@ async def send_template_text_message(request: TemplateTextMessageRequest):
             detail=f"Error sending template text message: {str(e)}"
         )
 
-@router.post("/template/image", response_model=TemplateMessageResponse)
+@router.post("/template/image", response_model=TemplateMessageResponse, response_model_exclude_none=True)
 async def send_template_image_message(request: TemplateImageMessageRequest):
     """
     Send a template-based image message via WhatsApp
@@ -2104,7 +2540,7 @@ async def send_template_image_message(request: TemplateImageMessageRequest):
             # Add image URL as first parameter if not already included
             template_params.insert(0, request.image_url)
         
-        result = await send_template_message(
+        result = await send_gupshup_template_message(
             app_config, 
             request.phone_number, 
             request.template_id, 
@@ -2117,7 +2553,7 @@ async def send_template_image_message(request: TemplateImageMessageRequest):
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return TemplateMessageResponse(
+            return TemplateMessageResponse.model_construct(
                 success=True,
                 message="Template image message sent successfully",
                 message_id=message_id,
@@ -2144,7 +2580,7 @@ async def send_template_image_message(request: TemplateImageMessageRequest):
             detail=f"Error sending template image message: {str(e)}"
         )
 
-@router.post("/template/video", response_model=TemplateMessageResponse)
+@router.post("/template/video", response_model=TemplateMessageResponse, response_model_exclude_none=True)
 async def send_template_video_message(request: TemplateVideoMessageRequest):
     """
     Send a template-based video message via WhatsApp
@@ -2160,7 +2596,7 @@ async def send_template_video_message(request: TemplateVideoMessageRequest):
         if request.video_url and request.video_url not in template_params:
             template_params.insert(0, request.video_url)
         
-        result = await send_template_message(
+        result = await send_gupshup_template_message(
             app_config, 
             request.phone_number, 
             request.template_id, 
@@ -2173,7 +2609,7 @@ async def send_template_video_message(request: TemplateVideoMessageRequest):
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return TemplateMessageResponse(
+            return TemplateMessageResponse.model_construct(
                 success=True,
                 message="Template video message sent successfully",
                 message_id=message_id,
@@ -2200,7 +2636,7 @@ async def send_template_video_message(request: TemplateVideoMessageRequest):
             detail=f"Error sending template video message: {str(e)}"
         )
 
-@router.post("/template/document", response_model=TemplateMessageResponse)
+@router.post("/template/document", response_model=TemplateMessageResponse, response_model_exclude_none=True)
 async def send_template_document_message(request: TemplateDocumentMessageRequest):
     """
     Send a template-based document message via WhatsApp
@@ -2220,7 +2656,7 @@ async def send_template_document_message(request: TemplateDocumentMessageRequest
         if request.filename and request.filename not in template_params:
             template_params.append(request.filename)
         
-        result = await send_template_message(
+        result = await send_gupshup_template_message(
             app_config, 
             request.phone_number, 
             request.template_id, 
@@ -2233,7 +2669,7 @@ async def send_template_document_message(request: TemplateDocumentMessageRequest
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return TemplateMessageResponse(
+            return TemplateMessageResponse.model_construct(
                 success=True,
                 message="Template document message sent successfully",
                 message_id=message_id,
@@ -2261,7 +2697,7 @@ async def send_template_document_message(request: TemplateDocumentMessageRequest
             detail=f"Error sending template document message: {str(e)}"
         )
 
-@router.post("/template/location", response_model=TemplateMessageResponse)
+@router.post("/template/location", response_model=TemplateMessageResponse, response_model_exclude_none=True)
 async def send_template_location_message(request: TemplateLocationMessageRequest):
     """
     Send a template-based location message via WhatsApp
@@ -2286,7 +2722,7 @@ async def send_template_location_message(request: TemplateLocationMessageRequest
         if request.address and request.address not in template_params:
             template_params.append(request.address)
         
-        result = await send_template_message(
+        result = await send_gupshup_template_message(
             app_config, 
             request.phone_number, 
             request.template_id, 
@@ -2299,7 +2735,7 @@ async def send_template_location_message(request: TemplateLocationMessageRequest
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return TemplateMessageResponse(
+            return TemplateMessageResponse.model_construct(
                 success=True,
                 message="Template location message sent successfully",
                 message_id=message_id,
@@ -2329,7 +2765,7 @@ async def send_template_location_message(request: TemplateLocationMessageRequest
             detail=f"Error sending template location message: {str(e)}"
         )
 
-@router.post("/template/coupon", response_model=TemplateMessageResponse)
+@router.post("/template/coupon", response_model=TemplateMessageResponse, response_model_exclude_none=True)
 async def send_template_coupon_message(request: TemplateCouponMessageRequest):
     """
     Send a template-based coupon message via WhatsApp
@@ -2345,7 +2781,7 @@ async def send_template_coupon_message(request: TemplateCouponMessageRequest):
         if request.coupon_code not in template_params:
             template_params.append(request.coupon_code)
         
-        result = await send_template_message(
+        result = await send_gupshup_template_message(
             app_config, 
             request.phone_number, 
             request.template_id, 
@@ -2358,7 +2794,7 @@ async def send_template_coupon_message(request: TemplateCouponMessageRequest):
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return TemplateMessageResponse(
+            return TemplateMessageResponse.model_construct(
                 success=True,
                 message="Template coupon message sent successfully",
                 message_id=message_id,
@@ -2385,7 +2821,7 @@ async def send_template_coupon_message(request: TemplateCouponMessageRequest):
             detail=f"Error sending template coupon message: {str(e)}"
         )
 
-@router.post("/template/carousel", response_model=TemplateMessageResponse)
+@router.post("/template/carousel", response_model=TemplateMessageResponse, response_model_exclude_none=True)
 async def send_template_carousel_message(request: TemplateCarouselMessageRequest):
     """
     Send a template-based carousel message via WhatsApp
@@ -2409,7 +2845,7 @@ async def send_template_carousel_message(request: TemplateCarouselMessageRequest
         for card in request.cards:
             template_params.extend([str(param) for component in card.components for param in component.values() if isinstance(param, (str, int, float))])
         
-        result = await send_template_message(
+        result = await send_gupshup_template_message(
             app_config, 
             request.phone_number, 
             request.template_id, 
@@ -2422,7 +2858,7 @@ async def send_template_carousel_message(request: TemplateCarouselMessageRequest
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return TemplateMessageResponse(
+            return TemplateMessageResponse.model_construct(
                 success=True,
                 message="Template carousel message sent successfully",
                 message_id=message_id,
@@ -2449,7 +2885,7 @@ async def send_template_carousel_message(request: TemplateCarouselMessageRequest
             detail=f"Error sending template carousel message: {str(e)}"
         )
 
-@router.post("/template/lto", response_model=TemplateMessageResponse)
+@router.post("/template/lto", response_model=TemplateMessageResponse, response_model_exclude_none=True)
 async def send_template_lto_message(request: TemplateLTOMessageRequest):
     """
     Send a template-based Limited Time Offer (LTO) message via WhatsApp
@@ -2465,7 +2901,7 @@ async def send_template_lto_message(request: TemplateLTOMessageRequest):
         if request.offer_expiry and request.offer_expiry not in template_params:
             template_params.append(request.offer_expiry)
         
-        result = await send_template_message(
+        result = await send_gupshup_template_message(
             app_config, 
             request.phone_number, 
             request.template_id, 
@@ -2478,7 +2914,7 @@ async def send_template_lto_message(request: TemplateLTOMessageRequest):
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return TemplateMessageResponse(
+            return TemplateMessageResponse.model_construct(
                 success=True,
                 message="Template LTO message sent successfully",
                 message_id=message_id,
@@ -2505,7 +2941,7 @@ async def send_template_lto_message(request: TemplateLTOMessageRequest):
             detail=f"Error sending template LTO message: {str(e)}"
         )
 
-@router.post("/template/mpm", response_model=TemplateMessageResponse)
+@router.post("/template/mpm", response_model=TemplateMessageResponse, response_model_exclude_none=True)
 async def send_template_mpm_message(request: TemplateMPMMessageRequest):
     """
     Send a template-based Multi Product Message (MPM) via WhatsApp
@@ -2528,7 +2964,7 @@ async def send_template_mpm_message(request: TemplateMPMMessageRequest):
                     if isinstance(value, str) and value not in template_params:
                         template_params.append(value)
         
-        result = await send_template_message(
+        result = await send_gupshup_template_message(
             app_config, 
             request.phone_number, 
             request.template_id, 
@@ -2541,7 +2977,7 @@ async def send_template_mpm_message(request: TemplateMPMMessageRequest):
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return TemplateMessageResponse(
+            return TemplateMessageResponse.model_construct(
                 success=True,
                 message="Template MPM message sent successfully",
                 message_id=message_id,
@@ -2569,7 +3005,7 @@ async def send_template_mpm_message(request: TemplateMPMMessageRequest):
             detail=f"Error sending template MPM message: {str(e)}"
         )
 
-@router.post("/template/catalog", response_model=TemplateMessageResponse)
+@router.post("/template/catalog", response_model=TemplateMessageResponse, response_model_exclude_none=True)
 async def send_template_catalog_message(request: TemplateCatalogMessageRequest):
     """
     Send a template-based catalog message via WhatsApp
@@ -2585,7 +3021,7 @@ async def send_template_catalog_message(request: TemplateCatalogMessageRequest):
         if request.catalog_id not in template_params:
             template_params.append(request.catalog_id)
         
-        result = await send_template_message(
+        result = await send_gupshup_template_message(
             app_config, 
             request.phone_number, 
             request.template_id, 
@@ -2598,7 +3034,7 @@ async def send_template_catalog_message(request: TemplateCatalogMessageRequest):
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return TemplateMessageResponse(
+            return TemplateMessageResponse.model_construct(
                 success=True,
                 message="Template catalog message sent successfully",
                 message_id=message_id,
@@ -2625,7 +3061,7 @@ async def send_template_catalog_message(request: TemplateCatalogMessageRequest):
             detail=f"Error sending template catalog message: {str(e)}"
         )
 
-@router.post("/template/authentication", response_model=TemplateMessageResponse)
+@router.post("/template/authentication", response_model=TemplateMessageResponse, response_model_exclude_none=True)
 async def send_template_authentication_message(request: TemplateAuthenticationRequest):
     """
     Send a template-based authentication message via WhatsApp (OTP, verification codes, etc.)
@@ -2635,7 +3071,7 @@ async def send_template_authentication_message(request: TemplateAuthenticationRe
     try:
         app_config = validate_app_config(request.app_name)
         
-        result = await send_template_message(
+        result = await send_gupshup_template_message(
             app_config, 
             request.phone_number, 
             request.template_id, 
@@ -2648,7 +3084,7 @@ async def send_template_authentication_message(request: TemplateAuthenticationRe
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return TemplateMessageResponse(
+            return TemplateMessageResponse.model_construct(
                 success=True,
                 message="Template authentication message sent successfully",
                 message_id=message_id,
@@ -2676,7 +3112,7 @@ async def send_template_authentication_message(request: TemplateAuthenticationRe
             detail=f"Error sending template authentication message: {str(e)}"
         )
 
-@router.post("/template/postback", response_model=TemplateMessageResponse)
+@router.post("/template/postback", response_model=TemplateMessageResponse, response_model_exclude_none=True)
 async def send_template_postback_message(request: PostbackTextRequest):
     """
     Send a template message with postback text support via WhatsApp
@@ -2692,7 +3128,7 @@ async def send_template_postback_message(request: PostbackTextRequest):
         if request.postback_text not in template_params:
             template_params.append(request.postback_text)
         
-        result = await send_template_message(
+        result = await send_gupshup_template_message(
             app_config, 
             request.phone_number, 
             request.template_id, 
@@ -2705,7 +3141,7 @@ async def send_template_postback_message(request: PostbackTextRequest):
             if isinstance(result["data"], dict):
                 message_id = result["data"].get("messageId") or result["data"].get("id")
             
-            return TemplateMessageResponse(
+            return TemplateMessageResponse.model_construct(
                 success=True,
                 message="Template postback message sent successfully",
                 message_id=message_id,
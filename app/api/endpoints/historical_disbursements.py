@@ -80,7 +80,7 @@ async def start_historical_processing(
             "started_at": datetime.now(),
             "completed_at": None,
             "errors": [],
-            "request": request.dict()
+            "request": request.model_dump()
         }
         
         # Start background processing
@@ -1,12 +1,15 @@
+import asyncio
 import logging
-from fastapi import APIRouter, HTTPException
-from app.services.basic_application_service import BasicApplicationService
+import weakref
+from collections import OrderedDict
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, HTTPException
+from app.services.database_service import database_service
+from app.services.basic_application_service import get_basic_app_service
 from app.models.schemas import LeadFlashRequest, LeadCreateRequest, LeadCreateResponse, LeadFlashResponse
 from app.utils.validators import (
-    validate_loan_type, validate_loan_amount, validate_loan_tenure,
-    validate_pan_number, validate_mobile_number, validate_pin_code,
-    validate_credit_score , validate_email, validate_first_name, validate_last_name,
-    validate_gender
+    validate_loan_type, validate_loan_tenure, validate_pan_number,
+    validate_credit_score, validate_gender, validate_application_id
 )
 
 # Setup logging
@@ -15,12 +18,90 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api_v1", tags=['leads'])
 
 # Initialize services
-basic_app_service = BasicApplicationService()
+basic_app_service = get_basic_app_service()
+
+CREDIT_SCORE_TYPE_ID = "e8a52d34-8e34-4b59-9737-bb92e69f6e78"
+
+# Successful create_lead results keyed by "<mobile>_<pan>", stored with the request payload
+created_leads_cache = TTLCache(maxsize=10_000, ttl=60)
+lead_creation_locks = weakref.WeakValueDictionary()
+
+# Lead flash fields the Self-Fulfillment API requires, with the value sent when empty
+LEAD_FLASH_FIELD_DEFAULTS = {
+    "annualIncome": 0,
+    "city": "",
+    "district": "",
+    "state": "",
+    "existingEmis": "",
+    "selfCompanyTypeName": "",
+    "canCustomerUploadDocuments": False,
+    "isOsvByConsultantAvailable": False,
+    "isLeadPrefilled": False,
+    "includeCreditScore": False,
+    "recentCreditReportExists": False,
+    "isPropertyIdentified": False,
+    "isReferralLead": False,
+    "projectId": "",
+    "creditScoreStatus": ""
+}
 
 ############################################################################################
                                 # Validate Lead Data
 ############################################################################################
 
+# (validator, request field, error message) - checked in order, first failure wins.
+# Mobile, PIN code, loan amount, email and names are enforced by the request schemas.
+LEAD_COMMON_RULES = (
+    (validate_loan_type, "loanType", "Invalid loan type"),
+)
+
+# Orbit additionally requires these fields on top of the common rules
+ORBIT_LEAD_RULES = LEAD_COMMON_RULES + (
+    (validate_loan_tenure, "loanTenure", "Loan tenure must be greater than 0"),
+    (validate_pan_number, "pan", "PAN number must be in format: ABCDE1234F"),
+    (validate_credit_score, "creditScore", "Credit score must be between 0 and 1000"),
+    (validate_gender, "gender", "Gender must be a valid gender"),
+)
+
+# Lead flash runs its environment's create rules plus these, in a single pass
+LEAD_FLASH_EXTRA_RULES = (
+    (validate_application_id, "applicationId", "Application ID is required for lead flash"),
+)
+LEAD_FLASH_RULES = {
+    "orbit": ORBIT_LEAD_RULES + LEAD_FLASH_EXTRA_RULES,
+    "homfinity": LEAD_COMMON_RULES + LEAD_FLASH_EXTRA_RULES,
+}
+
+
+# Field values that already passed a rule table, most recently used last.
+# Only successes are stored, so a failing payload is always re-checked.
+VALIDATED_LEADS_CACHE_SIZE = 4096
+validated_leads = OrderedDict()
+
+
+def apply_lead_rules(lead_data: LeadCreateRequest, rules: tuple):
+    """
+    Run each (validator, field, message) rule against the lead
+
+    Raises:
+        HTTPException: 422 with the message of the first failing rule
+    """
+    values = tuple(getattr(lead_data, field) for _, field, _ in rules)
+    cache_key = (id(rules), values)
+    if cache_key in validated_leads:
+        validated_leads.move_to_end(cache_key)
+        return True
+
+    for (validator, _, message), value in zip(rules, values):
+        if not validator(value):
+            raise HTTPException(status_code=422, detail=message)
+
+    validated_leads[cache_key] = True
+    if len(validated_leads) > VALIDATED_LEADS_CACHE_SIZE:
+        validated_leads.popitem(last=False)
+    return True
+
+
 def validate_orbit_lead_create_data(lead_data: LeadCreateRequest):
     """
     Validate lead data using comprehensive utility validators
@@ -42,75 +123,17 @@ def validate_orbit_lead_create_data(lead_data: LeadCreateRequest):
         HTTPException: If any validation fails with specific error message
             - 422: For field-specific validation errors (format, range, etc.)
     """
-    if not lead_data.environment:
-        raise HTTPException(status_code=422, detail="Environment is required and must be either 'orbit' or 'homfinity'")
-    elif lead_data.environment not in ["orbit", "homfinity"]:
-            raise HTTPException(status_code=422, detail="Environment is required and must be either 'orbit' or 'homfinity'")
-    
-    if not validate_loan_type(lead_data.loanType):
-        raise HTTPException(status_code=422, detail="Invalid loan type")
-    
-    if not validate_loan_amount(lead_data.loanAmountReq):
-        raise HTTPException(status_code=422, detail="Loan amount must be greater than 0")
-    
-    if not validate_loan_tenure(lead_data.loanTenure):
-        raise HTTPException(status_code=422, detail="Loan tenure must be greater than 0")
-    
-    if not validate_pan_number(lead_data.pan):
-        raise HTTPException(status_code=422, detail="PAN number must be in format: ABCDE1234F")
-    
-    if not validate_mobile_number(lead_data.mobile):
-        raise HTTPException(status_code=422, detail="Mobile number must be 10 digits")
-    
-    if not validate_pin_code(lead_data.pincode):
-        raise HTTPException(status_code=422, detail="PIN code must be 6 digits")
-    
-    if not validate_credit_score(lead_data.creditScore):
-        raise HTTPException(status_code=422, detail="Credit score must be between 0 and 1000")
-
-    if not validate_email(lead_data.email):
-        raise HTTPException(status_code=422, detail="Email must be a valid email address")
-    
-    if not validate_first_name(lead_data.firstName):
-        raise HTTPException(status_code=422, detail="First name must be a valid first name")
-    
-    if not validate_last_name(lead_data.lastName):
-        raise HTTPException(status_code=422, detail="Last name must be a valid last name")
-    
-    if not validate_gender(lead_data.gender):
-        raise HTTPException(status_code=422, detail="Gender must be a valid gender")
-
-    return True
+    return apply_lead_rules(lead_data, ORBIT_LEAD_RULES)
 
 
 def validate_homfinity_lead_create_data(lead_data: LeadCreateRequest):
-    if not lead_data.environment:
-        raise HTTPException(status_code=422, detail="Environment is required and must be either 'orbit' or 'homfinity'")
-    elif lead_data.environment not in ["orbit", "homfinity"]:
-            raise HTTPException(status_code=422, detail="Environment is required and must be either 'orbit' or 'homfinity'")
-    
-    if not validate_loan_type(lead_data.loanType):
-        raise HTTPException(status_code=422, detail="Invalid loan type")
-    
-    if not validate_loan_amount(lead_data.loanAmountReq):
-        raise HTTPException(status_code=422, detail="Loan amount must be greater than 0")
-    
-    if not validate_mobile_number(lead_data.mobile):
-        raise HTTPException(status_code=422, detail="Mobile number must be 10 digits")
-    
-    if not validate_pin_code(lead_data.pincode):
-        raise HTTPException(status_code=422, detail="PIN code must be 6 digits")
-    
-    if not validate_email(lead_data.email):
-        raise HTTPException(status_code=422, detail="Email must be a valid email address")
-    
-    if not validate_first_name(lead_data.firstName):
-        raise HTTPException(status_code=422, detail="First name must be a valid first name")
-    
-    if not validate_last_name(lead_data.lastName):
-        raise HTTPException(status_code=422, detail="Last name must be a valid last name")
-    
-    return True
+    """
+    Validate the lead fields required by every environment
+
+    Raises:
+        HTTPException: 422 if any validation fails
+    """
+    return apply_lead_rules(lead_data, LEAD_COMMON_RULES)
 
 
 ############################################################################################
@@ -157,72 +180,69 @@ async def create_lead_api(request: LeadCreateRequest):
         - Comprehensive error handling and audit trails
         - Support for lead modification (upserts based on existing records)
     """
-    # request.creditScoreTypeId = "e8a52d34-8e34-4b59-9737-bb92e69f6e78"
     request_id = f"{request.mobile}_{request.pan}"
-    logger.info(f"Starting lead creation for {request.firstName} {request.lastName}")
+    payload = request.model_dump()
+
+    # A retried identical request within the TTL gets the original result back
+    cached = created_leads_cache.get(request_id)
+    if cached and cached[0] == payload:
+        logger.info("Returning cached lead creation result for request: %s", request_id)
+        return cached[1]
+
+    # Serialise concurrent duplicates so only the first one calls the upstream API
+    lock = lead_creation_locks.setdefault(request_id, asyncio.Lock())
+    async with lock:
+        cached = created_leads_cache.get(request_id)
+        if cached and cached[0] == payload:
+            return cached[1]
+
+        response = await create_lead(request)
+        created_leads_cache[request_id] = (payload, response)
+        return response
+
+
+async def create_lead(request: LeadCreateRequest) -> LeadCreateResponse:
+    """Validate the lead, create it through CreateFBBByBasicUser and persist it"""
+    logger.info("Starting lead creation for %s %s", request.firstName, request.lastName)
     try:
         # Validate lead data
+        # Environment is constrained to 'orbit' / 'homfinity' by the request schema
         if request.environment == "orbit":
             validate_orbit_lead_create_data(request)
-        elif request.environment == "homfinity":
-            validate_homfinity_lead_create_data(request)
         else:
-            raise HTTPException(status_code=422, detail="Environment is required and must be either 'orbit' or 'homfinity'")
-
-        # Prepare data for API calls
-        api_data = {
-            "creditScore": request.creditScore,
-            "dateOfBirth": request.dateOfBirth,
-            "email": request.email,
-            "firstName": request.firstName,
-            "gender": request.gender,
-            "lastName": request.lastName,
-            "loanAmountReq": request.loanAmountReq,
-            "loanTenure": request.loanTenure,
-            "loanType": request.loanType,
-            "mobile": request.mobile,
-            "pan": request.pan,
-            "pincode": request.pincode,
-            "annualIncome": request.annualIncome,
-            "applicationAssignedToRm": request.applicationAssignedToRm,
-            "createdFromPemId": request.createdFromPemId,
-            "creditScoreTypeId": "e8a52d34-8e34-4b59-9737-bb92e69f6e78",  
-            "customerId": request.customerId,
-            "includeCreditScore": request.includeCreditScore,
-            "isLeadPrefilled": request.isLeadPrefilled,
-            "qrShortCode": request.qrShortCode,
-            "remarks": request.remarks,
-            "state": request.state,
-        }
+            validate_homfinity_lead_create_data(request)
+
+        # Prepare data for API calls (request fields map 1:1 onto the API payload keys)
+        api_data = request.model_dump(exclude={"environment"})
+        api_data["creditScoreTypeId"] = CREDIT_SCORE_TYPE_ID
 
         # Call CreateFBBByBasicUser API
-        fbb_user_result = basic_app_service.create_FBB_by_basic_user(api_data)
+        fbb_user_result = await basic_app_service.create_FBB_by_basic_user(api_data)
         
-        if not fbb_user_result:
-            error_msg = "Failed to create FBB record"
-            if fbb_user_result and fbb_user_result.get("responseException"):
-                error_msg = fbb_user_result.get("responseException", {}).get("exceptionMessage", error_msg)
-            logger.error(f"CreateFBBByBasicUser API failed: {error_msg}")
+        # An empty response, or one carrying a responseException, means the call failed
+        response_exception = (fbb_user_result or {}).get("responseException")
+        if not fbb_user_result or response_exception:
+            error_msg = (response_exception or {}).get("exceptionMessage") or "Failed to create FBB record"
+            logger.error("CreateFBBByBasicUser API failed: %s", error_msg)
             raise HTTPException(status_code=400, detail=f"FBB creation failed: {error_msg}")
      
+        fbb_result = fbb_user_result.get("result") or {}
+
         # Assigned to RM
-        assigned_to_rm = fbb_user_result.get("result", {}).get("applicationAssignedToRm", "") if fbb_user_result.get("result", {}).get("applicationAssignedToRm", "") else ""
+        assigned_to_rm = fbb_result.get("applicationAssignedToRm") or ""
         
         # Application ID
-        application_id = fbb_user_result.get("result", {}).get("id", "")
+        application_id = fbb_result.get("id", "")
 
         # Extract reference ID
-        application_comments = fbb_user_result.get("result", {}).get("applicationComments", [])
-        reference_id = ""
-        
-        if application_comments and len(application_comments) > 0:
-            reference_id = application_comments[0].get("refId", "")
+        application_comments = fbb_result.get("applicationComments")
+        reference_id = application_comments[0].get("refId", "") if application_comments else ""
             
         # if not reference_id:
         #     logger.error("Failed to extract reference ID from FBB response")
         #     raise HTTPException(status_code=400, detail="Failed to generate Reference ID")
 
-        basic_application_id = fbb_user_result.get("result", {}).get("basicAppId", "")
+        basic_application_id = fbb_result.get("basicAppId", "")
         if not basic_application_id:
             logger.error("Failed to extract Basic Application ID from FBB response")
             raise HTTPException(status_code=400, detail="Failed to generate Basic Application ID")
@@ -230,9 +250,6 @@ async def create_lead_api(request: LeadCreateRequest):
         # Save complete lead data to database
         try:
             logger.info("Saving lead data to database")
-            # Import here to avoid circular imports
-            from app.services.database_service import database_service
-            
             # Add source identification for create_lead endpoint
             api_data["source_endpoint"] = "create_lead"
             
@@ -245,16 +262,16 @@ async def create_lead_api(request: LeadCreateRequest):
             
             if db_result.get("success"):
                 operation_type = db_result.get("operation_type", "saved")
-                logger.info(f"Lead data {operation_type} in database with ID: {db_result.get('lead_id')}")
+                logger.info("Lead data %s in database with ID: %s", operation_type, db_result.get('lead_id'))
             else:
                 logger.warning("Database save did not return success status")
                 
         except Exception as db_error:
-            logger.error(f"Database save error: {str(db_error)}")
+            logger.error("Database save error: %s", db_error)
             # Don't fail the request if database save fails - lead was created successfully
 
         # Return successful response
-        logger.info(f"Successfully created lead - Basic App ID: {basic_application_id}")
+        logger.info("Successfully created lead - Basic App ID: %s", basic_application_id)
         
         return LeadCreateResponse(
             basic_application_id=basic_application_id,
@@ -267,7 +284,7 @@ async def create_lead_api(request: LeadCreateRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error in lead creation: {str(e)}")
+        logger.error("Unexpected error in lead creation: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
@@ -275,8 +292,37 @@ async def create_lead_api(request: LeadCreateRequest):
                                 # Lead Flash API
 ############################################################################################
 
+def save_lead_flash_data_in_background(api_data: dict, self_fullfilment_result: dict, environment: str) -> None:
+    """Persist lead flash data; failures are logged and never reach the caller"""
+    try:
+        logger.info("Saving lead flash data to database")
+        db_result = database_service.save_lead_data(
+            request_data=api_data, 
+            fbb_response=self_fullfilment_result, 
+            self_fullfilment_response=self_fullfilment_result,
+            environment=environment
+        )
+        
+        if db_result.get("success"):
+            operation_type = db_result.get("operation_type", "saved")
+            logger.info("Lead flash data %s in database with ID: %s", operation_type, db_result.get('lead_id'))
+        else:
+            logger.warning("Database save did not return success status")
+            
+    except Exception as db_error:
+        logger.error("Database save error: %s", db_error)
+
+
+async def run_basic_fullfilment(api_data: dict) -> None:
+    """Call the optional Basic Fulfillment API; failures are logged, never raised"""
+    try:
+        await basic_app_service.create_fullfilment_using_application_id(api_data)
+    except Exception as e:
+        logger.warning("Basic Fulfillment API warning: %s - continuing with self fulfillment", e)
+
+
 @router.post("/lead_flash", response_model=LeadFlashResponse)
-async def lead_flash_api(request: LeadFlashRequest):
+async def lead_flash_api(request: LeadFlashRequest, background_tasks: BackgroundTasks):
     """
     Process a complete lead flash workflow with comprehensive application details
     
@@ -321,106 +367,20 @@ async def lead_flash_api(request: LeadFlashRequest):
         - Integration with WhatsApp notification system
         - Support for complex property and employment scenarios
     """
-    logger.info(f"Processing lead flash request for application ID: {request.applicationId}")
+    logger.info("Processing lead flash request for application ID: %s", request.applicationId)
     
     try:
         # Validate all input data
-        # validate_lead_flash_data(request)
-        if request.environment == "orbit":
-            validate_orbit_lead_create_data(request)
-        elif request.environment == "homfinity":
-            validate_homfinity_lead_create_data(request)
-        else:
-            raise HTTPException(status_code=422, detail="Environment is required and must be either 'orbit' or 'homfinity'")
-        
-        # Ensure application ID is provided
-        if not request.applicationId:
-            raise HTTPException(status_code=422, detail="Application ID is required for lead flash")
+        # Environment is constrained to 'orbit' / 'homfinity' by the request schema
+        apply_lead_rules(request, LEAD_FLASH_RULES[request.environment])
         
-        # Prepare data for API calls
-        api_data = {
-            # Core Personal Information
-            "firstName": request.firstName,
-            "lastName": request.lastName,
-            "gender": request.gender,
-            "mobile": request.mobile,
-            "email": request.email,
-            "dateOfBirth": request.dateOfBirth,
-            "pan": request.pan,
-            
-            # Application Information
-            "applicationId": request.applicationId,
-            "creditScore": request.creditScore,
-            "loanType": request.loanType,
-            "loanAmountReq": request.loanAmountReq,   
-            "loanTenure": request.loanTenure,
-            "pincode": request.pincode,
-            
-            # Location Information
-            "location": request.location,
-            
-            # Profession Information
-            "professionId": request.professionId, 
-            "professionName": request.professionName,
-            
-            # Financial Information
-            "coBorrowerIncome": request.coBorrowerIncome,
-            "salaryCreditModeId": request.salaryCreditModeId, 
-            "salaryCreditModeName": request.salaryCreditModeName,
-            "selfCompanyTypeId": request.selfCompanyTypeId,
-            "companyName": request.companyName,
-            
-            # Property Information
-            "propertyIdentified": request.propertyIdentified,
-            "propertyName": request.propertyName,
-            "propertyType": request.propertyType,
-            "agreementType": request.agreementType,
-            "propertyTypeId": request.propertyTypeId,
-            "propertyValue": request.propertyValue,
-            "propertyDistrict": request.propertyDistrict,
-            "propertyPincode": request.propertyPincode,
-            "propertyProjectName": request.propertyProjectName,
-            
-            # Property Details
-            "unitType": request.unitType,
-            "usageType": request.usageType,
-            "unitNumber": request.unitNumber,
-            "towerName": request.towerName,
-            "towerUnitType": request.towerUnitType,
-            "builderId": request.builderId,
-            "towerId": request.towerId,
-            "builderName": request.builderName,
-            
-            # Loan Configuration
-            "loanUsageTypeId": request.loanUsageTypeId,
-            "aggrementTypeId": request.aggrementTypeId,
-            
-            # Credit Information
-            "creditScoreTypeId": "e8a52d34-8e34-4b59-9737-bb92e69f6e78",
-            "creditScoreTypeName": request.creditScoreTypeName,
-            "manualCreditScore": request.manualCreditScore,
-            
-            # Documents and Processing
-            "documents": request.documents,
-            "isVistedNextPage": request.isVistedNextPage,
-            
-            # **MISSING FIELDS ADDED - Required by Self-Fulfillment API:**
-            "annualIncome": request.annualIncome or 0,
-            "city": request.city or "",
-            "district": request.district or "",
-            "state": request.state or "",
-            "existingEmis": request.existingEmis or "",
-            "selfCompanyTypeName": request.selfCompanyTypeName or "",
-            "canCustomerUploadDocuments": request.canCustomerUploadDocuments or False,
-            "isOsvByConsultantAvailable": request.isOsvByConsultantAvailable or False,
-            "isLeadPrefilled": request.isLeadPrefilled or False,
-            "includeCreditScore": request.includeCreditScore or False,
-            "recentCreditReportExists": request.recentCreditReportExists or False,
-            "isPropertyIdentified": request.isPropertyIdentified or False,
-            "isReferralLead": request.isReferralLead or False,
-            "projectId": request.projectId or "",
-            "creditScoreStatus": request.creditScoreStatus or ""
-        }   
+        # Prepare data for API calls (request fields map 1:1 onto the API payload keys)
+        api_data = request.model_dump(exclude={"environment"})
+        api_data["creditScoreTypeId"] = CREDIT_SCORE_TYPE_ID
+
+        # Fields required by the Self-Fulfillment API, defaulted when not provided
+        for field, default in LEAD_FLASH_FIELD_DEFAULTS.items():
+            api_data[field] = api_data[field] or default
 
         # TODO: Temporary logic to identify property and profession details (Need to be removed later)
         if api_data.get("propertyType") or api_data.get("agreementType") or api_data.get("usageType"):
@@ -432,63 +392,54 @@ async def lead_flash_api(request: LeadFlashRequest):
             api_data["salaryCreditModeId"] = None
             api_data["salaryCreditModeName"] = None
 
-        # Call Basic Fulfillment API (optional step)
+        # Basic Fulfillment (optional) and Self Fulfillment (required) are independent
+        # calls on the same payload, so run them concurrently. The task group cancels
+        # whatever is still in flight if the request is cancelled or Self Fulfillment fails.
         try:
-            basic_app_service.create_fullfilment_using_application_id(api_data)
-        except Exception as e:
-            logger.warning(f"Basic Fulfillment API warning: {str(e)} - continuing with self fulfillment")
-            # Continue processing even if this step fails
+            async with asyncio.TaskGroup() as task_group:
+                task_group.create_task(run_basic_fullfilment(api_data))
+                self_fullfilment_task = task_group.create_task(
+                    basic_app_service.create_self_fullfilment_lead(api_data)
+                )
+        except ExceptionGroup as exc_group:
+            # Only Self Fulfillment can fail here; surface its original exception
+            raise exc_group.exceptions[0]
 
-        # Call Self Fulfillment API (required step)
-        self_fullfilment_result = basic_app_service.create_self_fullfilment_lead(api_data)
+        self_fullfilment_result = self_fullfilment_task.result()
         
-        if not self_fullfilment_result:
-            error_msg = "Failed to create self fulfillment record"
-            if self_fullfilment_result and self_fullfilment_result.get("responseException"):
-                error_msg = self_fullfilment_result.get("responseException", {}).get("exceptionMessage", error_msg)
-            logger.error(f"Self Fulfillment API failed: {error_msg}")
+        # An empty response, or one carrying a responseException, means the call failed
+        response_exception = (self_fullfilment_result or {}).get("responseException")
+        if not self_fullfilment_result or response_exception:
+            error_msg = (response_exception or {}).get("exceptionMessage") or "Failed to create self fulfillment record"
+            logger.error("Self Fulfillment API failed: %s", error_msg)
             raise HTTPException(status_code=400, detail=f"Self fulfillment failed: {error_msg}")
         
         logger.info("Self Fulfillment API completed successfully")
         
+        self_fullfilment_data = self_fullfilment_result.get("result") or {}
+
         # Extract Basic Application ID
-        basic_application_id = self_fullfilment_result.get("result", {}).get("basicAppId")
-        reference_id = self_fullfilment_result.get("result", {}).get("id","")
+        basic_application_id = self_fullfilment_data.get("basicAppId")
+        reference_id = self_fullfilment_data.get("id", "")
         # Assigned to RM
-        assigned_to_rm = self_fullfilment_result.get("result", {}).get("applicationAssignedToRm", "") if self_fullfilment_result.get("result", {}).get("applicationAssignedToRm", "") else ""
+        assigned_to_rm = self_fullfilment_data.get("applicationAssignedToRm") or ""
         
         if not basic_application_id:
             logger.error("Failed to extract Basic Application ID from self fulfillment response")
             raise HTTPException(status_code=400, detail="Failed to generate Basic Application ID")
 
-        # Save complete lead data to database
-        try:
-            logger.info("Saving lead flash data to database")
-            # Import here to avoid circular imports
-            from app.services.database_service import database_service
-            
-            # Add source identification for lead_flash endpoint
-            api_data["source_endpoint"] = "lead_flash"
-            
-            db_result = database_service.save_lead_data(
-                request_data=api_data, 
-                fbb_response=self_fullfilment_result, 
-                self_fullfilment_response=self_fullfilment_result,
-                environment=request.environment
-            )
-            
-            if db_result.get("success"):
-                operation_type = db_result.get("operation_type", "saved")
-                logger.info(f"Lead flash data {operation_type} in database with ID: {db_result.get('lead_id')}")
-            else:
-                logger.warning("Database save did not return success status")
-                
-        except Exception as db_error:
-            logger.error(f"Database save error: {str(db_error)}")
-            # Don't fail the request if database save fails - lead was created successfully
+        # Save complete lead data to database after the response is sent - a failed
+        # save doesn't fail the request, the lead was created successfully
+        api_data["source_endpoint"] = "lead_flash"
+        background_tasks.add_task(
+            save_lead_flash_data_in_background,
+            api_data,
+            self_fullfilment_result,
+            request.environment
+        )
 
         # Return successful response
-        logger.info(f"Successfully created lead flash - Basic App ID: {basic_application_id}")
+        logger.info("Successfully created lead flash - Basic App ID: %s", basic_application_id)
         
         return LeadFlashResponse(
             basic_application_id=basic_application_id,
@@ -500,6 +451,6 @@ async def lead_flash_api(request: LeadFlashRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error in lead flash creation: {str(e)}")
+        logger.error("Unexpected error in lead flash creation: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
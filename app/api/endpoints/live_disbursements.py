@@ -82,7 +82,7 @@ async def start_live_monitoring(config: LiveMonitoringConfig) -> Dict[str, Any]:
             "emails_processed": 0,
             "disbursements_found": 0,
             "errors": [],
-            "config": config.dict(),
+            "config": config.model_dump(),
             "processed_email_ids": set(),  # Reset processed emails tracking
             "latest_disbursements": [],  # Reset latest disbursements
             "last_disbursement_check": None,
@@ -106,7 +106,7 @@ async def start_live_monitoring(config: LiveMonitoringConfig) -> Dict[str, Any]:
         return {
             "success": True,
             "message": "Live monitoring started successfully",
-            "config": config.dict(),
+            "config": config.model_dump(),
             "started_at": monitoring_state["started_at"].isoformat()
         }
         
@@ -1,9 +1,9 @@
 import logging
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, BackgroundTasks, HTTPException
 from app.utils.validators import validate_mobile_number
 from app.services.whatsapp_service import whatsapp_service
 from app.services.database_service import database_service
-from app.services.basic_application_service import BasicApplicationService
+from app.services.basic_application_service import get_basic_app_service
 from app.models.schemas import (LeadStatusRequest, LeadStatusResponse,TrackApplicationRequest, TrackApplicationResponse,
                                 BookAppointmentRequest, BookAppointmentResponse)
 
@@ -12,25 +12,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api_v1", tags=["track_leads"])
 
 # Initialize services
-basic_app_service = BasicApplicationService()
-
-############################################################################################
-                                # Validate Book Appointment Data
-############################################################################################
-
-def validate_book_appointment_data(request:BookAppointmentRequest):
-    """Validate book appointment data"""
-    if not request.environment:
-        raise HTTPException(status_code=422, detail="Environment is required and must be either 'orbit' or 'homfinity'")
-    elif request.environment not in ["orbit", "homfinity"]:
-            raise HTTPException(status_code=422, detail="Environment is required and must be either 'orbit' or 'homfinity'")
-    
-    if not request.date or not request.time:
-        raise HTTPException(status_code=422, detail="Date and time are required")
-    
-    if not request.reference_id:
-        raise HTTPException(status_code=422, detail="Reference ID is required")
-
+basic_app_service = get_basic_app_service()
 
 ############################################################################################
                                  # Lead Status API #
@@ -40,11 +22,6 @@ def validate_book_appointment_data(request:BookAppointmentRequest):
 async def get_lead_status(status_request: LeadStatusRequest):
     """Get lead status by various identifiers"""
 
-    if not status_request.environment:
-        raise HTTPException(status_code=422, detail="Environment is required and must be either 'orbit' or 'homfinity'")
-    elif status_request.environment not in ["orbit", "homfinity"]:
-            raise HTTPException(status_code=422, detail="Environment is required and must be either 'orbit' or 'homfinity'")
-    
     try:
         # Validate that at least one identifier is provided
         if not any([status_request.mobile_number, status_request.basic_application_id]):
@@ -132,11 +109,6 @@ async def get_lead_status(status_request: LeadStatusRequest):
 async def get_track_application_status(status_request: TrackApplicationRequest):
     """Get lead status by various identifiers"""
 
-    if not status_request.environment:
-        raise HTTPException(status_code=422, detail="Environment is required and must be either 'orbit' or 'homfinity'")
-    elif status_request.environment not in ["orbit", "homfinity"]:
-            raise HTTPException(status_code=422, detail="Environment is required and must be either 'orbit' or 'homfinity'")
-    
     try:
         # Validate that at least one identifier is provided
         if not any([status_request.mobile_number, status_request.basic_application_id]):
@@ -226,34 +198,38 @@ async def get_track_application_status(status_request: TrackApplicationRequest):
                                 # Book Appointment API #
 ############################################################################################
 
+def save_book_appointment_in_background(api_data, result, environment):
+    """Persist a booked appointment; failures are logged and never reach the caller"""
+    try:
+        database_service.save_book_appointment_data(api_data, result, environment=environment)
+    except Exception as db_error:
+        logger.error(f"Failed to save book appointment to database. - {db_error}")
+
+
 @router.post("/book_appointment", response_model=BookAppointmentResponse)
-async def rm_book_appointment(request:BookAppointmentRequest):
+async def rm_book_appointment(request:BookAppointmentRequest, background_tasks: BackgroundTasks):
     "Book an appointment"
     try:
-        # Validate lead data
-        validate_book_appointment_data(request)
-
         # Prepare data for Application API
         api_data = {"date": request.date, "time": request.time, "reference_id": request.reference_id, 
         "assigned_to_user_id": request.assigned_to_user_id, "assigned_to_user_name": request.assigned_to_user_name,
         "created_by_user_name": request.created_by_user_name} 
 
         # Call Basic Application API - Create Lead(CreateAppointmentByBasicUser)
-        result = basic_app_service.create_appointment_by_basic_user(api_data)
+        result = await basic_app_service.create_appointment_by_basic_user(api_data)
         logger.info(f"Book appointment API call completed for reference: {request.reference_id}")
 
         basic_app_id = result.get("result",{}).get("basicAppId", "")
         if not basic_app_id:
             raise HTTPException(status_code=400, detail="Failed to get basic application ID")
         
-        # Save to database
-        try:
-            from app.services.database_service import database_service
-            
-            db_result = database_service.save_book_appointment_data(api_data, result, environment=request.environment)
-        except Exception as db_error:
-            logger.error(f"Failed to save book appointment to database. - {db_error}")
-            # Don't fail the request if database save fails
+        # Save to database after the response is sent - a failed save doesn't fail the request
+        background_tasks.add_task(
+            save_book_appointment_in_background,
+            api_data,
+            result,
+            request.environment
+        )
 
         return BookAppointmentResponse(
             basic_application_id=basic_app_id,
@@ -1,10 +1,9 @@
-import re
 import json
 import logging
-from typing import Optional, Dict, Any
-from fastapi import APIRouter, HTTPException, Request, Form
-from app.models.schemas import WhatsAppStatusResponse
-from app.services.basic_application_service import BasicApplicationService
+import orjson
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Request
+from app.services.basic_application_service import get_basic_app_service
 from app.services.whatsapp_service import whatsapp_service
 from app.services.database_service import database_service
 from app.config.settings import settings
@@ -14,7 +13,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api_v1", tags=["whatsapp-webhook"])
 
 # Initialize services
-basic_app_service = BasicApplicationService()
+basic_app_service = get_basic_app_service()
 
 ############################################################################################
                                 # WhatsApp Webhook Validation
@@ -66,12 +65,12 @@ async def whatsapp_webhook(request: Request):
         # Try to parse as JSON
         try:
             if content_type.startswith("application/json"):
-                body = await request.json()
+                body = orjson.loads(raw_body)
             else:
                 # Try to parse raw body as JSON anyway
                 body_text = raw_body.decode('utf-8')
                 logger.info(f"Raw body text: {body_text[:500]}...")  # Log first 500 chars
-                body = json.loads(body_text)
+                body = orjson.loads(body_text)
         except json.JSONDecodeError as json_error:
             logger.error(f"JSON decode error: {json_error}")
             logger.error(f"Raw body: {raw_body.decode('utf-8', errors='ignore')}")
@@ -85,7 +84,7 @@ async def whatsapp_webhook(request: Request):
             
             return {"status": "error", "message": f"Invalid JSON: {str(json_error)}"}
         
-        logger.info(f"Received webhook payload: {json.dumps(body, indent=2)}")
+        logger.info(f"Received webhook payload: {orjson.dumps(body, option=orjson.OPT_INDENT_2).decode()}")
         
         # Extract data from Gupshup payload structure
         app_name = body.get("app")
@@ -121,7 +120,7 @@ async def whatsapp_webhook(request: Request):
                 message_data = {
                     "mobile": sender_phone,
                     "message": message_text,
-                    "payload": json.dumps(body)  # Save the entire payload as JSON string
+                    "payload": orjson.dumps(body).decode()  # Save the entire payload as JSON string
                 }
                 
                 save_result = database_service.save_whatsapp_message(message_data)
@@ -271,10 +270,6 @@ async def ghupshup_whatsapp_webhook(request: Request):
     Webhook endpoint that receives WhatsApp messages from Gupshup
     This endpoint is called automatically by WhatsApp when a message is received
     """
-
-    print("---------------Gupshup WhatsApp Webhook API---------------------------")
-    print(request)
-    print("---------------Gupshup WhatsApp Webhook API---------------------------")
     try:
         # Log request details for debugging
         content_type = request.headers.get("content-type", "")
@@ -292,12 +287,12 @@ async def ghupshup_whatsapp_webhook(request: Request):
         # Try to parse as JSON
         try:
             if content_type.startswith("application/json"):
-                body = await request.json()
+                body = orjson.loads(raw_body)
             else:
                 # Try to parse raw body as JSON anyway
                 body_text = raw_body.decode('utf-8')
                 logger.info(f"Raw body text: {body_text[:500]}...")  # Log first 500 chars
-                body = json.loads(body_text)
+                body = orjson.loads(body_text)
         except json.JSONDecodeError as json_error:
             logger.error(f"JSON decode error: {json_error}")
             logger.error(f"Raw body: {raw_body.decode('utf-8', errors='ignore')}")
@@ -311,7 +306,7 @@ async def ghupshup_whatsapp_webhook(request: Request):
             
             return {"status": "error", "message": f"Invalid JSON: {str(json_error)}"}
         
-        logger.info(f"Received webhook payload: {json.dumps(body, indent=2)}")
+        logger.info(f"Received webhook payload: {orjson.dumps(body, option=orjson.OPT_INDENT_2).decode()}")
         
         # Extract data from Gupshup payload structure
         app_name = body.get("app")
@@ -30,6 +30,18 @@ class Settings:
     GUPSHUP_API_MSG_URL = os.getenv("GUPSHUP_API_MSG_URL", "https://api.gupshup.io/wa/api/v1/msg")
     GUPSHUP_API_KEY = os.getenv("GUPSHUP_API_KEY", "")
     GUPSHUP_SOURCE = os.getenv("GUPSHUP_SOURCE", "")
+    # Messages per second the app sends to Gupshup in bulk, shared by all bulk requests
+    GUPSHUP_MAX_RPS = float(os.getenv("GUPSHUP_MAX_RPS", "20"))
+    # Background workers and queue capacity for ?async=true sends
+    GUPSHUP_WORKERS = int(os.getenv("GUPSHUP_WORKERS", "8"))
+    GUPSHUP_SEND_QUEUE_SIZE = int(os.getenv("GUPSHUP_SEND_QUEUE_SIZE", "10000"))
+    # Seconds shutdown waits for queued sends to go out before dropping the rest
+    GUPSHUP_SHUTDOWN_DRAIN_TIMEOUT = float(os.getenv("GUPSHUP_SHUTDOWN_DRAIN_TIMEOUT", "20"))
+    # Upper bound on Gupshup API requests in flight at once (adjustable at runtime)
+    GUPSHUP_MAX_IN_FLIGHT = int(os.getenv("GUPSHUP_MAX_IN_FLIGHT", "100"))
+    # Retries for 429 responses and connection failures, with exponential backoff from the base delay
+    GUPSHUP_MAX_RETRIES = int(os.getenv("GUPSHUP_MAX_RETRIES", "5"))
+    GUPSHUP_RETRY_BASE_DELAY = float(os.getenv("GUPSHUP_RETRY_BASE_DELAY", "0.5"))
 
     # Multi-App Gupshup Configuration
     # App configurations are loaded dynamically from environment variables
@@ -1,19 +1,40 @@
 import sys
+import asyncio
+import queue
 import logging
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config.settings import settings
 from app.api.routes import api_router
-from fastapi.middleware.cors import CORSMiddleware
+from app.services.basic_application_service import basic_http_client
+from app.services.gupshup_client import close_gupshup_clients, drain_gupshup_send_queue, gupshup_send_worker
+
+# Configure logging: request handlers only enqueue records, the listener
+# thread does the actual stdout/file writes
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+log_handlers = [
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler('basicverify.log')
+]
+for handler in log_handlers:
+    handler.setFormatter(log_formatter)
+
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+log_listener.start()
+
+# The queue handler only merges args into the message; the listener's
+# handlers apply the real format
+queue_handler = QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
 
-# Configure logging
+# force=True: app.config.config already called basicConfig during the imports above
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('basicverify.log')
-    ]
+    handlers=[queue_handler],
+    force=True
 )
 
 # Suppress httpx request logs
@@ -25,11 +46,30 @@ logging.getLogger("requests").setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the Gupshup send workers for the app's lifetime, then drain them and close shared clients"""
+    # Background workers that deliver ?async=true Gupshup sends
+    app.state.gupshup_send_workers = [
+        asyncio.create_task(gupshup_send_worker()) for _ in range(settings.GUPSHUP_WORKERS)
+    ]
+    yield
+    # Sends already answered with 202 go out before the workers are stopped
+    await drain_gupshup_send_queue(settings.GUPSHUP_SHUTDOWN_DRAIN_TIMEOUT)
+    for worker in app.state.gupshup_send_workers:
+        worker.cancel()
+    await asyncio.gather(*app.state.gupshup_send_workers, return_exceptions=True)
+    # Close shared outbound HTTP clients and flush queued log records
+    await basic_http_client.aclose()
+    await close_gupshup_clients()
+    log_listener.stop()
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.API_TITLE,
     description=settings.API_DESCRIPTION,
-    version=settings.API_VERSION
+    version=settings.API_VERSION,
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -44,7 +84,6 @@ app.add_middleware(
 app.include_router(api_router)
 
 
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -1,5 +1,5 @@
 from typing import Optional, List, Dict, Any, Literal
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 
 ############################### Basic Verify Approval Schemas ##################################
@@ -19,10 +19,10 @@ class BasicVerifyApprovalResponse(BaseModel):
 ################################# Book Appointment Schemas #####################################
 
 class BookAppointmentRequest(BaseModel):
-    environment: Optional[str] = "orbit"
-    date: str
-    time: str
-    reference_id: str
+    environment: Literal["orbit", "homfinity"] = "orbit"
+    date: str = Field(..., min_length=1)
+    time: str = Field(..., min_length=1)
+    reference_id: str = Field(..., min_length=1)
     assigned_to_user_id: Optional[str] = None
     assigned_to_user_name: Optional[str] = None
     created_by_user_name: Optional[str] = None
@@ -128,19 +128,29 @@ class DisbursementStatsResponse(BaseModel):
 
 ################################# Lead Create Schemas #####################################
 
+# Fields shared by every environment are checked by pydantic at parse time;
+# environment-specific rules live in app/api/endpoints/leads.py.
+# Unanchored: the value must contain at least one non-whitespace character
+NON_BLANK_PATTERN = r'\S'
+
+# Lead requests are read-only once parsed
+LEAD_REQUEST_CONFIG = ConfigDict(frozen=True)
+
 class LeadCreateRequest(BaseModel):
-    environment: Optional[str] = "orbit"
-    firstName: str
-    lastName: str
+    model_config = LEAD_REQUEST_CONFIG
+
+    environment: Literal["orbit", "homfinity"] = "orbit"
+    firstName: str = Field(..., pattern=NON_BLANK_PATTERN)
+    lastName: str = Field(..., pattern=NON_BLANK_PATTERN)
     gender: Optional[str] = None
-    mobile: str
+    mobile: str = Field(..., pattern=r'^[0-9]{10}$')
     pan: str
     email: EmailStr
     state: Optional[str] = None
-    pincode: str
+    pincode: str = Field(..., pattern=r'^[0-9]{6}$')
     loanType: str
     loanTenure: int
-    loanAmountReq: float 
+    loanAmountReq: float = Field(..., gt=0)
     dateOfBirth: str
     creditScore: Optional[int] = 700
     customerId: Optional[str] = None
@@ -163,20 +173,22 @@ class LeadCreateResponse(BaseModel):
 ################################# Lead Flash Schemas ##############################################
 
 class LeadFlashRequest(BaseModel):
-    environment: Optional[str] = "orbit"
-    firstName: str
-    lastName: str
+    model_config = LEAD_REQUEST_CONFIG
+
+    environment: Literal["orbit", "homfinity"] = "orbit"
+    firstName: str = Field(..., pattern=NON_BLANK_PATTERN)
+    lastName: str = Field(..., pattern=NON_BLANK_PATTERN)
     gender: Optional[str] = None
-    mobile: str
+    mobile: str = Field(..., pattern=r'^[0-9]{10}$')
     email: EmailStr
     pan: str
     dateOfBirth: str
     creditScore: int
     applicationId: str
-    loanAmountReq: float
+    loanAmountReq: float = Field(..., gt=0)
     loanTenure: int
     loanType: str
-    pincode: str
+    pincode: str = Field(..., pattern=r'^[0-9]{6}$')
     location: Optional[str] = None
     professionId: str
     professionName: str
@@ -235,7 +247,7 @@ class LeadFlashResponse(BaseModel):
 ################################# Lead Status Schemas #####################################
 
 class LeadStatusRequest(BaseModel):
-    environment: Optional[str] = "orbit"
+    environment: Literal["orbit", "homfinity"] = "orbit"
     mobile_number: Optional[str] = None
     basic_application_id: Optional[str] = None
 
@@ -244,7 +256,7 @@ class LeadStatusResponse(BaseModel):
     message: str
 
 class TrackApplicationRequest(BaseModel):
-    environment: Optional[str] = "orbit"
+    environment: Literal["orbit", "homfinity"] = "orbit"
     mobile_number: Optional[str] = None
     basic_application_id: Optional[str] = None
 
@@ -310,7 +322,8 @@ class PhoneNumberRequest(BaseModel):
     """Base request with phone number validation"""
     phone_number: str = Field(..., description="Phone number (supports multiple formats)")
     
-    @validator('phone_number')
+    @field_validator('phone_number')
+    @classmethod
     def validate_phone_number(cls, v):
         from app.utils.validators import normalize_phone_number
         return normalize_phone_number(v)
@@ -1,24 +1,42 @@
 import os
+import re
 import hmac
 import uuid
 import json
 import base64
 import hashlib
+import httpx
 import logging
-import requests
 from datetime import datetime
+from functools import lru_cache
 from fastapi import HTTPException
 from typing import Dict, Optional
 from app.config.settings import settings
+from app.services.database_service import database_service
 from urllib.parse import urlparse, parse_qsl, urlencode
 
 logger = logging.getLogger(__name__)
 
+MERIDIEM_PATTERN = re.compile(r'\s*(AM|PM)\s*')
+
+# Shared client for all Basic Application API calls so keep-alive connections
+# (and their TLS sessions) are reused across requests; closed on app shutdown.
+# Bodies are sent as json.dumps(payload) because that exact string is what
+# generate_signature_headers hashes (httpx's json= uses compact separators).
+basic_http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=httpx.Timeout(30.0, connect=5.0),
+    limits=httpx.Limits(max_keepalive_connections=50, max_connections=200)
+)
+
 
 class BasicApplicationService:
     """Service for handling Basic Application API integration"""
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        # Defaults to the shared module-level client; pass one in to own its lifecycle elsewhere
+        self.http_client = http_client or basic_http_client
+
         self.basic_api_url = os.getenv("BASIC_APPLICATION_API_URL")
         
         self.BASIC_APPLICATION_USER_ID = os.getenv("BASIC_APPLICATION_USER_ID")
@@ -237,10 +255,6 @@ class BasicApplicationService:
         date = lead_data.get("date", "")
         time = lead_data.get("time", "")
         
-        # Import required modules for date/time handling
-        from datetime import datetime, timezone
-        import re
-        
         def parse_and_format_datetime(date_str, time_str):
             """Parse various date/time formats and return ISO 8601 format"""
             try:
@@ -281,7 +295,7 @@ class BasicApplicationService:
                     is_am = 'AM' in time_clean
                     
                     # Remove AM/PM indicators
-                    time_clean = re.sub(r'\s*(AM|PM)\s*', '', time_clean)
+                    time_clean = MERIDIEM_PATTERN.sub('', time_clean)
                     
                     # Try to parse different time formats
                     time_formats = [
@@ -384,7 +398,7 @@ class BasicApplicationService:
         }
         return headers
     
-    def create_lead(self, lead_data: Dict) -> Dict:
+    async def create_lead(self, lead_data: Dict) -> Dict:
         """
         Create lead in Basic Application API
         
@@ -413,7 +427,7 @@ class BasicApplicationService:
                  api_payload,
                  self.BASIC_APPLICATION_AGENT_USER_ID,
                  self.BASIC_APPLICATION_AGENT_API_KEY)
-            response = requests.post(api_url, headers=headers, json=api_payload)
+            response = await self.http_client.post(api_url, headers=headers, content=json.dumps(api_payload))
 
             if response.status_code in [200, 201]:
                 try:
@@ -444,7 +458,7 @@ class BasicApplicationService:
             raise HTTPException(status_code=500, detail=f"Error calling Basic Application API: {str(e)}")
     
     # Leads Creation API using CreateFBBByBasicUser
-    def create_FBB_by_basic_user(self, lead_data: Dict) -> Dict:
+    async def create_FBB_by_basic_user(self, lead_data: Dict) -> Dict:
         """
         Create lead in Basic Application API(CreateFBBByBasicUser)
         
@@ -458,9 +472,8 @@ class BasicApplicationService:
             HTTPException: If API call fails
         """
         try:
-            print("Payload first:", lead_data)
             api_payload = self._prepare_FBB_by_basic_user_payload(lead_data)
-            print("Payload changed:", api_payload)
+            logger.debug("CreateFBBByBasicUser payload: %s", api_payload)
             
             if not self.basic_api_url:
                 raise HTTPException(
@@ -476,7 +489,7 @@ class BasicApplicationService:
                  self.BASIC_APPLICATION_USER_ID,
                  self.BASIC_APPLICATION_API_KEY)
 
-            response = requests.post(api_url, headers=headers, json=api_payload)
+            response = await self.http_client.post(api_url, headers=headers, content=json.dumps(api_payload))
 
             if response.status_code in [200, 201]:
                 try:
@@ -507,7 +520,7 @@ class BasicApplicationService:
             raise HTTPException(status_code=500, detail=f"Error calling Basic Application API: {str(e)}")
     
     # API for Fullfilment by Basic User by application id
-    def create_fullfilment_using_application_id(self, lead_data: Dict) -> Dict:
+    async def create_fullfilment_using_application_id(self, lead_data: Dict) -> Dict:
         """
         Use this API to create fullfilment by basic user by application id
 
@@ -539,7 +552,7 @@ class BasicApplicationService:
                  api_payload,
                  self.BASIC_APPLICATION_USER_ID,
                  self.BASIC_APPLICATION_API_KEY)
-            response = requests.put(api_url, headers=headers, json=api_payload)
+            response = await self.http_client.put(api_url, headers=headers, content=json.dumps(api_payload))
 
             if response.status_code in [200, 201]:
                 try:
@@ -571,7 +584,7 @@ class BasicApplicationService:
     
 
     # Leads Creation API using SelfFullfilment
-    def create_self_fullfilment_lead(self, lead_data: Dict) -> Dict:
+    async def create_self_fullfilment_lead(self, lead_data: Dict) -> Dict:
         """
         Create lead in Basic Application API(SelfFullfilment)
         
@@ -600,7 +613,7 @@ class BasicApplicationService:
                  api_payload,
                  self.BASIC_APPLICATION_USER_ID,
                  self.BASIC_APPLICATION_API_KEY)
-            response = requests.put(api_url, headers=headers, json=api_payload)
+            response = await self.http_client.put(api_url, headers=headers, content=json.dumps(api_payload))
 
             if response.status_code in [200, 201]:
                 try:
@@ -649,9 +662,6 @@ class BasicApplicationService:
                     detail="Basic Application API URL not configured"
                 )
             
-            # Import database service here to avoid circular imports
-            from app.services.database_service import database_service
-            
             # Initialize variables
             final_mobile_number = None
             final_basic_application_id = None
@@ -693,7 +703,7 @@ class BasicApplicationService:
                      self.BASIC_APPLICATION_USER_ID,
                      self.BASIC_APPLICATION_API_KEY)
                 
-                response = requests.get(api_url, headers=headers)
+                response = await self.http_client.get(api_url, headers=headers)
                     
                 if response.status_code == 200:
                     try:
@@ -721,7 +731,7 @@ class BasicApplicationService:
 
 
     # Leads Creation API using CreateFBBByBasicUser
-    def create_appointment_by_basic_user(self, lead_data: Dict) -> Dict:
+    async def create_appointment_by_basic_user(self, lead_data: Dict) -> Dict:
         """
         Create/book appointment in Basic Application API
         
@@ -749,7 +759,7 @@ class BasicApplicationService:
                  api_payload,
                  self.BASIC_APPLICATION_USER_ID,
                  self.BASIC_APPLICATION_API_KEY)
-            response = requests.post(api_url, headers=headers, json=api_payload)
+            response = await self.http_client.post(api_url, headers=headers, content=json.dumps(api_payload))
 
             if response.status_code in [200, 201]:
                 try:
@@ -778,4 +788,9 @@ class BasicApplicationService:
             raise
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error calling Basic Application API: {str(e)}")
-    
\ No newline at end of file
+
+
+@lru_cache(maxsize=1)
+def get_basic_app_service() -> BasicApplicationService:
+    """Shared BasicApplicationService instance, created on first use"""
+    return BasicApplicationService()
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import httpx
+from functools import lru_cache
+from typing import Dict
+from aiolimiter import AsyncLimiter
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+def new_gupshup_http_client() -> httpx.AsyncClient:
+    """Create a pooled HTTP/2 client for one Gupshup host"""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=60)
+    )
+
+# One shared client per Gupshup host so keep-alive connections (and their TLS
+# sessions) are reused and each host gets its own pool limits; all are closed
+# on app shutdown
+gupshup_http_clients: Dict[str, httpx.AsyncClient] = {}
+
+@lru_cache(maxsize=64)
+def gupshup_host(url: str) -> str:
+    return httpx.URL(url).host
+
+def gupshup_client_for(url: str) -> httpx.AsyncClient:
+    """Return the shared client for the host of a Gupshup URL"""
+    host = gupshup_host(url)
+    client = gupshup_http_clients.get(host)
+    if client is None:
+        client = gupshup_http_clients[host] = new_gupshup_http_client()
+    return client
+
+async def close_gupshup_clients():
+    """Close every per-host Gupshup client"""
+    for client in list(gupshup_http_clients.values()):
+        await client.aclose()
+    gupshup_http_clients.clear()
+
+# Token bucket shared by every bulk send so concurrent batches together stay
+# under Gupshup's per-second cap
+gupshup_rate_limiter = AsyncLimiter(settings.GUPSHUP_MAX_RPS, 1)
+
+class GupshupAdmission:
+    """
+    Caps the number of Gupshup API requests in flight
+    
+    A counter guarded by an asyncio.Condition rather than a Semaphore so the
+    limit can be raised or lowered while requests are waiting.
+    """
+    
+    def __init__(self, max_in_flight: int):
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self.condition = asyncio.Condition()
+    
+    async def acquire(self):
+        async with self.condition:
+            try:
+                await self.condition.wait_for(lambda: self.in_flight < self.max_in_flight)
+            except asyncio.CancelledError:
+                # A waiter cancelled after being woken would swallow the wake-up meant
+                # for a free slot; pass it on so the next waiter is not left hanging
+                self.condition.notify(1)
+                raise
+            self.in_flight += 1
+    
+    async def release(self):
+        # Give the slot back before any await so a cancelled caller cannot leak it;
+        # the wake-up is shielded so a waiter is still notified if we are cancelled
+        self.in_flight -= 1
+        await asyncio.shield(self.notify_waiter())
+    
+    async def notify_waiter(self):
+        async with self.condition:
+            self.condition.notify(1)
+    
+    async def set_max_in_flight(self, max_in_flight: int):
+        """Change the limit; waiters are re-checked immediately"""
+        async with self.condition:
+            self.max_in_flight = max_in_flight
+            self.condition.notify_all()
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.release()
+
+gupshup_admission = GupshupAdmission(settings.GUPSHUP_MAX_IN_FLIGHT)
+
+# Sends accepted with ?async=true wait here for the background workers; the
+# bounded size is the admission limit (callers get 429 once it is full)
+gupshup_send_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.GUPSHUP_SEND_QUEUE_SIZE)
+# Set on shutdown so no new sends are queued while the workers drain the backlog
+gupshup_send_queue_closed = asyncio.Event()
+
+async def gupshup_send_worker():
+    """Drain queued sends; each item is a (queued_id, zero-argument coroutine function) pair"""
+    while True:
+        queued_id, send = await gupshup_send_queue.get()
+        try:
+            result = await send()
+            if not result.get("success"):
+                logger.warning("Queued Gupshup send %s failed: %s", queued_id, result.get("data"))
+        except Exception:
+            logger.exception("Queued Gupshup send %s raised", queued_id)
+        finally:
+            gupshup_send_queue.task_done()
+
+async def drain_gupshup_send_queue(timeout: float):
+    """Stop accepting queued sends and wait up to timeout seconds for the workers to deliver the rest"""
+    gupshup_send_queue_closed.set()
+    try:
+        await asyncio.wait_for(gupshup_send_queue.join(), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning(
+            "Gupshup send queue not drained within %ss, dropping %d queued sends",
+            timeout, gupshup_send_queue.qsize()
+        )
@@ -1,8 +1,8 @@
-import json
-import httpx
+import orjson
 import random
 from fastapi import HTTPException
 from app.config.settings import settings
+from app.services.gupshup_client import gupshup_admission, gupshup_client_for
 
 class WhatsAppService:
     """Service for handling WhatsApp message sending using Gupshup API with different templates"""
@@ -74,39 +74,39 @@ class WhatsAppService:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
+            async with gupshup_admission:
+                response = await gupshup_client_for(self.api_template_url).post(
                     self.api_template_url,
                     headers=headers,
                     data=data,
                     timeout=30.0
                 )
                 
-                # Gupshup API returns 202 for successful submissions (accepted for processing)
-                if response.status_code in [200, 202]:
-                    try:
-                        # Try to parse JSON response
-                        response_data = response.json()
-                        # Ensure response_data is a dictionary
-                        if isinstance(response_data, dict):
-                            data_dict = response_data
-                        else:
-                            data_dict = {"response": str(response_data)}
-                    except json.JSONDecodeError:
-                        # If JSON parsing fails, use text response
-                        data_dict = {"response": response.text}
+            # Gupshup API returns 202 for successful submissions (accepted for processing)
+            if response.status_code in [200, 202]:
+                try:
+                    # Try to parse JSON response
+                    response_data = orjson.loads(response.content)
+                    # Ensure response_data is a dictionary
+                    if isinstance(response_data, dict):
+                        data_dict = response_data
+                    else:
+                        data_dict = {"response": str(response_data)}
+                except orjson.JSONDecodeError:
+                    # If JSON parsing fails, use text response
+                    data_dict = {"response": response.text}
                     
-                    return {
-                        "success": True,
-                        "message": "OTP sent successfully",
-                        "data": data_dict
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "message": f"Failed to send OTP. Status: {response.status_code}",
-                        "data": {"error": response.text}
-                    }
+                return {
+                    "success": True,
+                    "message": "OTP sent successfully",
+                    "data": data_dict
+                }
+            else:
+                return {
+                    "success": False,
+                    "message": f"Failed to send OTP. Status: {response.status_code}",
+                    "data": {"error": response.text}
+                }
                     
         except Exception as e:
             return {
@@ -148,37 +148,37 @@ class WhatsAppService:
             'source': self.source,
             'destination': phone_number,
             'src.name': self.lead_creation_src_name,
-            'template': f'{{"id":"{self.lead_creation_template_id}","params":{json.dumps(template_params)}}}'
+            'template': f'{{"id":"{self.lead_creation_template_id}","params":{orjson.dumps(template_params).decode()}}}'
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
+            async with gupshup_admission:
+                response = await gupshup_client_for(self.api_template_url).post(
                     self.api_template_url,
                     headers=headers,
                     data=data,
                     timeout=30.0
                 )
                 
-                # Gupshup API returns 202 for successful submissions
-                if response.status_code in [200, 202]:
-                    try:
-                        response_data = response.json()
-                        data_dict = response_data if isinstance(response_data, dict) else {"response": str(response_data)}
-                    except json.JSONDecodeError:
-                        data_dict = {"response": response.text}
+            # Gupshup API returns 202 for successful submissions
+            if response.status_code in [200, 202]:
+                try:
+                    response_data = orjson.loads(response.content)
+                    data_dict = response_data if isinstance(response_data, dict) else {"response": str(response_data)}
+                except orjson.JSONDecodeError:
+                    data_dict = {"response": response.text}
                     
-                    return {
-                        "success": True,
-                        "message": "Lead creation confirmation sent successfully",
-                        "data": data_dict
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "message": f"Failed to send lead creation confirmation. Status: {response.status_code}",
-                        "data": {"error": response.text}
-                    }
+                return {
+                    "success": True,
+                    "message": "Lead creation confirmation sent successfully",
+                    "data": data_dict
+                }
+            else:
+                return {
+                    "success": False,
+                    "message": f"Failed to send lead creation confirmation. Status: {response.status_code}",
+                    "data": {"error": response.text}
+                }
                     
         except Exception as e:
             return {
@@ -214,37 +214,37 @@ class WhatsAppService:
             'source': self.source,
             'destination': phone_number,
             'src.name': self.lead_status_src_name,
-            'template': f'{{"id":"{self.lead_status_template_id}","params":{json.dumps(template_params)}}}'
+            'template': f'{{"id":"{self.lead_status_template_id}","params":{orjson.dumps(template_params).decode()}}}'
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
+            async with gupshup_admission:
+                response = await gupshup_client_for(self.api_template_url).post(
                     self.api_template_url,
                     headers=headers,
                     data=data,
                     timeout=30.0
                 )
                 
-                # Gupshup API returns 202 for successful submissions
-                if response.status_code in [200, 202]:
-                    try:
-                        response_data = response.json()
-                        data_dict = response_data if isinstance(response_data, dict) else {"response": str(response_data)}
-                    except json.JSONDecodeError:
-                        data_dict = {"response": response.text}
+            # Gupshup API returns 202 for successful submissions
+            if response.status_code in [200, 202]:
+                try:
+                    response_data = orjson.loads(response.content)
+                    data_dict = response_data if isinstance(response_data, dict) else {"response": str(response_data)}
+                except orjson.JSONDecodeError:
+                    data_dict = {"response": response.text}
                     
-                    return {
-                        "success": True,
-                        "message": "Lead status update sent successfully",
-                        "data": data_dict
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "message": f"Failed to send lead status update. Status: {response.status_code}",
-                        "data": {"error": response.text}
-                    }
+                return {
+                    "success": True,
+                    "message": "Lead status update sent successfully",
+                    "data": data_dict
+                }
+            else:
+                return {
+                    "success": False,
+                    "message": f"Failed to send lead status update. Status: {response.status_code}",
+                    "data": {"error": response.text}
+                }
                     
         except Exception as e:
             return {
@@ -279,33 +279,33 @@ class WhatsAppService:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
+            async with gupshup_admission:
+                response = await gupshup_client_for(self.api_msg_url).post(
                     self.api_msg_url,
                     headers=headers,
                     data=data,
                     timeout=30.0
                 )
                 
-                # Gupshup API returns 202 for successful submissions
-                if response.status_code in [200, 202]:
-                    try:
-                        response_data = response.json()
-                        data_dict = response_data if isinstance(response_data, dict) else {"response": str(response_data)}
-                    except json.JSONDecodeError:
-                        data_dict = {"response": response.text}
+            # Gupshup API returns 202 for successful submissions
+            if response.status_code in [200, 202]:
+                try:
+                    response_data = orjson.loads(response.content)
+                    data_dict = response_data if isinstance(response_data, dict) else {"response": str(response_data)}
+                except orjson.JSONDecodeError:
+                    data_dict = {"response": response.text}
                     
-                    return {
-                        "success": True,
-                        "message": "Message sent successfully",
-                        "data": data_dict
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "message": f"Failed to send message. Status: {response.status_code}",
-                        "data": {"error": response.text}
-                    }
+                return {
+                    "success": True,
+                    "message": "Message sent successfully",
+                    "data": data_dict
+                }
+            else:
+                return {
+                    "success": False,
+                    "message": f"Failed to send message. Status: {response.status_code}",
+                    "data": {"error": response.text}
+                }
                     
         except Exception as e:
             return {
@@ -341,37 +341,37 @@ class WhatsAppService:
             'source': app_config["source"],
             'src.name': app_config["app_name"],
             'destination': phone_number,
-            'message': json.dumps(message)
+            'message': orjson.dumps(message).decode()
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
+            async with gupshup_admission:
+                response = await gupshup_client_for(self.api_msg_url).post(
                     self.api_msg_url,
                     headers=headers,
                     data=data,
                     timeout=30.0
                 )
                 
-                # Gupshup API returns 202 for successful submissions
-                if response.status_code in [200, 202]:
-                    try:
-                        response_data = response.json()
-                        data_dict = response_data if isinstance(response_data, dict) else {"response": str(response_data)}
-                    except json.JSONDecodeError:
-                        data_dict = {"response": response.text}
+            # Gupshup API returns 202 for successful submissions
+            if response.status_code in [200, 202]:
+                try:
+                    response_data = orjson.loads(response.content)
+                    data_dict = response_data if isinstance(response_data, dict) else {"response": str(response_data)}
+                except orjson.JSONDecodeError:
+                    data_dict = {"response": response.text}
                     
-                    return {
-                        "success": True,
-                        "message": "Message sent successfully",
-                        "data": data_dict
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "message": f"Failed to send message. Status: {response.status_code}",
-                        "data": {"error": response.text}
-                    }
+                return {
+                    "success": True,
+                    "message": "Message sent successfully",
+                    "data": data_dict
+                }
+            else:
+                return {
+                    "success": False,
+                    "message": f"Failed to send message. Status: {response.status_code}",
+                    "data": {"error": response.text}
+                }
                     
         except Exception as e:
             return {
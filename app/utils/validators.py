@@ -1,22 +1,33 @@
 import re
 from typing import List
+from functools import lru_cache
 from pydantic import BaseModel, Field
 from app.config.settings import settings
 
+# Compiled once at import so the per-request validators only run the match
+PAN_NUMBER_PATTERN = re.compile(r'^[A-Z]{5}[0-9]{4}[A-Z]{1}$')
+MOBILE_NUMBER_PATTERN = re.compile(r'^[0-9]{10}$')
+PIN_CODE_PATTERN = re.compile(r'^[0-9]{6}$')
+NORMALIZED_PHONE_PATTERN = re.compile(r'^\+91[1-9]\d{9,11}$')
+PHONE_SEPARATORS_PATTERN = re.compile(r'[\s\-\(\)]')
+
 ###############################################################################
                # Validators for Lead Creation & Whatsapp OTP
 ###############################################################################
+@lru_cache(maxsize=4096)
 def validate_pan_number(pan: str) -> bool:
     """Validate PAN number format"""
-    return bool(re.match(r'^[A-Z]{5}[0-9]{4}[A-Z]{1}$', pan))
+    return bool(PAN_NUMBER_PATTERN.match(pan))
 
+@lru_cache(maxsize=4096)
 def validate_mobile_number(mobile: str) -> bool:
     """Validate mobile number format"""
-    return bool(re.match(r'^[0-9]{10}$', mobile))
+    return bool(MOBILE_NUMBER_PATTERN.match(mobile))
 
+@lru_cache(maxsize=4096)
 def validate_pin_code(pin: str) -> bool:
     """Validate PIN code format"""
-    return bool(re.match(r'^[0-9]{6}$', pin))
+    return bool(PIN_CODE_PATTERN.match(pin))
 
 def validate_loan_amount(amount: float) -> bool:
     """Validate loan amount"""
@@ -30,14 +41,17 @@ def validate_annual_income(income: float) -> bool:
     """Validate annual income"""
     return income > 0
 
+@lru_cache(maxsize=4096)
 def validate_city(city: str) -> bool:
     """Validate city"""
     return city.strip() != ""
 
+@lru_cache(maxsize=4096)
 def validate_state(state: str) -> bool:
     """Validate state"""
     return state.strip() != ""
 
+@lru_cache(maxsize=4096)
 def validate_district(district: str) -> bool:
     """Validate district"""
     return district.strip() != ""
@@ -46,6 +60,7 @@ def validate_credit_score(creditScore: int) -> bool:
     """Validate credit score"""
     return creditScore > 0 and creditScore <= 1000
 
+@lru_cache(maxsize=4096)
 def validate_email(email: str) -> bool:
     """Validate email"""
     return email.strip() != ""
@@ -58,10 +73,12 @@ def validate_last_name(lastName: str) -> bool:
     """Validate last name"""
     return lastName.strip() != ""
 
+@lru_cache(maxsize=4096)
 def validate_gender(gender: str) -> bool:
     """Validate gender"""
     return gender.strip() != ""
 
+@lru_cache(maxsize=4096)
 def validate_loan_type(loanType: str) -> bool:
     """Validate loan type"""
     valid_types = settings.LOAN_TYPE_MAPPING.keys()
@@ -111,11 +128,11 @@ def validate_phone_number(phone_number: str) -> bool:
     try:
         normalized = normalize_phone_number(phone_number)
         # Check if normalized number is valid (starts with +91 and has 10-12 digits after country code)
-        pattern = r'^\+91[1-9]\d{9,11}$'
-        return bool(re.match(pattern, normalized))
+        return bool(NORMALIZED_PHONE_PATTERN.match(normalized))
     except:
         return False
 
+@lru_cache(maxsize=8192)
 def normalize_phone_number(phone_number: str) -> str:
     """
     Normalize phone number to include country code 91.
@@ -126,8 +143,12 @@ def normalize_phone_number(phone_number: str) -> str:
     - +917888888888 (with + prefix)
     - 0788888888 (with leading 0)
     """
+    # Already canonical (+91 followed by 10 digits): nothing to clean up
+    if len(phone_number) == 13 and phone_number.startswith('+91') and phone_number[1:].isascii() and phone_number[1:].isdigit():
+        return phone_number
+
     # Remove any spaces, dashes, or other separators
-    cleaned = re.sub(r'[\s\-\(\)]', '', phone_number)
+    cleaned = PHONE_SEPARATORS_PATTERN.sub('', phone_number)
     
     # Remove + prefix if present
     if cleaned.startswith('+'):
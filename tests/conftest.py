@@ -0,0 +1,45 @@
+"""
+Shared test setup
+
+A "demo" Gupshup app is configured through the environment before the app
+modules are imported, and Gupshup routes are served from a bare FastAPI app so
+the route tests never start the send workers or touch the log files.
+"""
+
+import asyncio
+import os
+
+os.environ.setdefault("DEMO_GUPSHUP_APP_ID", "demo-app-id")
+os.environ.setdefault("DEMO_GUPSHUP_API_KEY", "demo-api-key")
+os.environ.setdefault("DEMO_GUPSHUP_SOURCE", "919999999999")
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def gupshup_api():
+    """TestClient for the Gupshup router with its caches reset"""
+    from app.api.endpoints import gupshup_apis
+
+    gupshup_apis.templates_cache.clear()
+    app = FastAPI()
+    app.include_router(gupshup_apis.router)
+    with TestClient(app) as client:
+        yield client
+    gupshup_apis.templates_cache.clear()
+
+
+@pytest.fixture
+def send_queue(monkeypatch):
+    """A fresh ?async=true send queue and closed flag, so tests don't share loop-bound state"""
+    from app.api.endpoints import gupshup_apis
+    from app.services import gupshup_client
+
+    send_queue = asyncio.Queue(maxsize=2)
+    closed = asyncio.Event()
+    for module in (gupshup_client, gupshup_apis):
+        monkeypatch.setattr(module, "gupshup_send_queue", send_queue)
+        monkeypatch.setattr(module, "gupshup_send_queue_closed", closed)
+    return send_queue
@@ -0,0 +1,531 @@
+import asyncio
+from urllib.parse import parse_qs
+
+import httpx
+import orjson
+import pytest
+from aiolimiter import AsyncLimiter
+from fastapi import Response
+
+from app.api.endpoints import gupshup_apis
+from app.api.endpoints.gupshup_apis import TEXT_MESSAGE_JSON, BulkMessageRequest, dump_json
+
+
+@pytest.mark.parametrize("text", [
+    "hello",
+    "",
+    'she said "hi"',
+    "C:\\path\\to\\file \\n not a newline",
+    "line one\nline two\r\n\ttabbed",
+    "{curly} {{braces}} {0}",
+    "नमस्ते, आपका लोन स्वीकृत हो गया है",
+    "Congrats 🎉🏠 your loan is approved ✅",
+    "control \x00\x1f chars",
+])
+def test_text_message_json_matches_dict_serialization(text):
+    payload_json = TEXT_MESSAGE_JSON.format(text=dump_json(text))
+
+    assert orjson.loads(payload_json) == {"type": "text", "text": text}
+    assert payload_json == dump_json({"type": "text", "text": text})
+
+
+@pytest.fixture
+def gupshup_calls(monkeypatch):
+    """Replace the Gupshup HTTP call with a recorder; numbers ending in 0000 fail"""
+    calls = []
+
+    async def fake_send_gupshup_request(api_url, form_body, headers):
+        calls.append(form_body)
+        if "0000" in form_body:
+            return {"success": False, "status_code": 400, "data": {"error": "rejected"}, "error": "rejected"}
+        return {"success": True, "data": {"messageId": f"m{len(calls)}"}}
+
+    monkeypatch.setattr(gupshup_apis, "send_gupshup_request", fake_send_gupshup_request)
+    return calls
+
+
+def text_batch_item(item_id, phone_number="9876543210", app_name="demo"):
+    return {
+        "id": item_id,
+        "path": "/send-text",
+        "body": {"app_name": app_name, "phone_number": phone_number, "message": "hi"},
+    }
+
+
+def test_batch_rejects_more_than_100_requests(gupshup_api, gupshup_calls):
+    response = gupshup_api.post(
+        "/api_v1/gupshup/batch",
+        json={"requests": [text_batch_item(str(i)) for i in range(101)]},
+    )
+
+    assert response.status_code == 422
+    assert gupshup_calls == []
+
+
+def test_batch_accepts_100_requests(gupshup_api, gupshup_calls, monkeypatch):
+    # Lift the app-wide pacing so a full batch does not take five seconds
+    monkeypatch.setattr(gupshup_apis, "gupshup_rate_limiter", AsyncLimiter(1000, 1))
+
+    response = gupshup_api.post(
+        "/api_v1/gupshup/batch",
+        json={"requests": [text_batch_item(str(i)) for i in range(100)]},
+    )
+
+    assert response.status_code == 200
+    assert len(response.json()["results"]) == 100
+    assert len(gupshup_calls) == 100
+
+
+def test_batch_rejects_unknown_path(gupshup_api, gupshup_calls):
+    item = text_batch_item("a")
+    item["path"] = "/send-otp"
+
+    response = gupshup_api.post("/api_v1/gupshup/batch", json={"requests": [item]})
+
+    assert response.status_code == 422
+    assert gupshup_calls == []
+
+
+def test_batch_item_failures_do_not_fail_the_others(gupshup_api, gupshup_calls):
+    invalid_media = {
+        "id": "bad-body",
+        "path": "/send-media",
+        "body": {"app_name": "demo", "phone_number": "9876543210", "media_type": "gif"},
+    }
+
+    response = gupshup_api.post("/api_v1/gupshup/batch", json={"requests": [
+        text_batch_item("ok"),
+        text_batch_item("bad-app", app_name="missing"),
+        invalid_media,
+        text_batch_item("rejected", phone_number="9876500000"),
+    ]})
+
+    assert response.status_code == 200
+    results = {result["id"]: result for result in response.json()["results"]}
+    assert [result["id"] for result in response.json()["results"]] == ["ok", "bad-app", "bad-body", "rejected"]
+
+    assert results["ok"]["status"] == 200
+    assert results["ok"]["body"]["success"] is True
+
+    assert results["bad-app"]["status"] == 400
+    assert "missing" in results["bad-app"]["body"]["detail"]
+
+    assert results["bad-body"]["status"] == 422
+    assert {error["loc"][0] for error in results["bad-body"]["body"]["detail"]} == {"media_type", "media_url"}
+
+    assert results["rejected"]["status"] == 200
+    assert results["rejected"]["body"]["success"] is False
+    assert results["rejected"]["body"]["message"] == "Failed to send text message"
+
+    assert len(gupshup_calls) == 2
+
+
+def parse_sse(body: str):
+    """Split an SSE body into (event name, parsed data) pairs"""
+    events = []
+    for block in body.split("\n\n"):
+        if not block:
+            continue
+        fields = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((fields.get("event", "message"), orjson.loads(fields["data"])))
+    return events
+
+
+def test_bulk_stream_emits_one_event_per_number_then_a_summary(gupshup_api, gupshup_calls):
+    response = gupshup_api.post("/api_v1/gupshup/send-bulk-stream", json={
+        "app_name": "demo",
+        "phone_numbers": ["9876543210", "+91 98765 43210", "9876543211", "9876500000"],
+        "message_type": "text",
+        "message_data": {"message": "hi"},
+    })
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text.endswith("\n\n")
+
+    events = parse_sse(response.text)
+    results = [data for event, data in events if event == "message"]
+    assert [event for event, _ in events] == ["message"] * 3 + ["summary"]
+    assert sorted(result["phone_number"] for result in results) == ["+919876500000", "+919876543210", "+919876543211"]
+    assert {result["phone_number"]: result["success"] for result in results}["+919876500000"] is False
+    assert events[-1][1] == {"total_sent": 3, "duplicates_dropped": 1, "successful": 2, "failed": 1}
+    assert len(gupshup_calls) == 3
+
+
+def test_bulk_stream_cancels_pending_sends_when_closed_early(monkeypatch):
+    async def scenario():
+        cancelled = []
+
+        async def send_one(phone_number):
+            if phone_number.endswith("1"):
+                return {"phone_number": phone_number, "success": True, "message": "sent"}
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(phone_number)
+                raise
+
+        monkeypatch.setattr(gupshup_apis, "prepare_bulk_sender", lambda request: send_one)
+        request = BulkMessageRequest(
+            app_name="demo",
+            phone_numbers=["9876543211", "9876543212", "9876543213"],
+            message_type="text",
+            message_data={"message": "hi"},
+        )
+
+        response = await gupshup_apis.send_bulk_messages_stream(request)
+        first_event = await response.body_iterator.__anext__()
+        # The client going away closes the generator before the remaining sends finish
+        await response.body_iterator.aclose()
+        await asyncio.sleep(0)
+        # Copy before asyncio.run cancels whatever is still pending at loop shutdown
+        return first_event, list(cancelled)
+
+    first_event, cancelled = asyncio.run(scenario())
+
+    assert parse_sse(first_event) == [("message", {"phone_number": "+919876543211", "success": True, "message": "sent"})]
+    assert sorted(cancelled) == ["+919876543212", "+919876543213"]
+
+
+@pytest.fixture
+def template_fetches(monkeypatch):
+    """Replace the Gupshup templates call; each fetch returns a new template id"""
+    fetches = []
+
+    async def fake_get_templates_from_gupshup(app_id, api_key, template_status=None):
+        fetches.append(template_status)
+        return {"success": True, "data": {"templates": [{"id": f"t{len(fetches)}"}]}}
+
+    monkeypatch.setattr(gupshup_apis, "get_templates_from_gupshup", fake_get_templates_from_gupshup)
+    return fetches
+
+
+def get_templates(client, **params):
+    response = client.get("/api_v1/gupshup/templates/by-app", params={"app_name": "demo", **params})
+    assert response.status_code == 200
+    return response.headers["X-Cache"], response.json()["data"]["templates"]
+
+
+def test_templates_are_cached_per_app_and_status(gupshup_api, template_fetches):
+    assert get_templates(gupshup_api) == ("MISS", [{"id": "t1"}])
+    assert get_templates(gupshup_api) == ("HIT", [{"id": "t1"}])
+    assert get_templates(gupshup_api, template_status="APPROVED") == ("MISS", [{"id": "t2"}])
+    assert get_templates(gupshup_api, template_status="APPROVED") == ("HIT", [{"id": "t2"}])
+    assert template_fetches == [None, "APPROVED"]
+
+
+def test_templates_refresh_bypasses_and_repopulates_the_cache(gupshup_api, template_fetches):
+    get_templates(gupshup_api)
+
+    assert get_templates(gupshup_api, refresh="true") == ("MISS", [{"id": "t2"}])
+    assert get_templates(gupshup_api) == ("HIT", [{"id": "t2"}])
+    assert len(template_fetches) == 2
+
+
+def test_templates_invalidate(gupshup_api, template_fetches):
+    get_templates(gupshup_api)
+    get_templates(gupshup_api, template_status="APPROVED")
+
+    response = gupshup_api.post("/api_v1/gupshup/templates/invalidate", params={"app_name": "other"})
+    assert response.json()["data"] == {"app_name": "other", "removed": 0}
+    assert get_templates(gupshup_api)[0] == "HIT"
+
+    response = gupshup_api.post("/api_v1/gupshup/templates/invalidate", params={"app_name": "demo"})
+    assert response.json()["data"] == {"app_name": "demo", "removed": 2}
+    assert get_templates(gupshup_api)[0] == "MISS"
+
+    response = gupshup_api.post("/api_v1/gupshup/templates/invalidate")
+    assert response.json()["data"] == {"app_name": None, "removed": 1}
+    assert get_templates(gupshup_api)[0] == "MISS"
+
+
+def test_template_fetches_are_single_flight_per_key(monkeypatch):
+    async def scenario():
+        gupshup_apis.templates_cache.clear()
+        release_approved = asyncio.Event()
+        fetches = []
+
+        async def fake_get_templates_from_gupshup(app_id, api_key, template_status=None):
+            fetches.append(template_status)
+            if template_status == "APPROVED":
+                await release_approved.wait()
+            return {"success": True, "data": []}
+
+        monkeypatch.setattr(gupshup_apis, "get_templates_from_gupshup", fake_get_templates_from_gupshup)
+
+        def fetch(template_status):
+            return asyncio.create_task(gupshup_apis.get_templates_by_app_name(
+                Response(), app_name="demo", template_status=template_status
+            ))
+
+        approved = [fetch("APPROVED") for _ in range(3)]
+        await asyncio.sleep(0)
+        # A different listing is not held up by the slow APPROVED fetch
+        await asyncio.wait_for(fetch("PENDING"), timeout=1)
+        release_approved.set()
+        await asyncio.gather(*approved)
+        gupshup_apis.templates_cache.clear()
+        return fetches
+
+    assert asyncio.run(scenario()) == ["APPROVED", "PENDING"]
+
+
+def gupshup_response(status_code, **headers):
+    return httpx.Response(status_code, headers=headers, request=httpx.Request("POST", "https://api.gupshup.io/wa/api/v1/msg"))
+
+
+@pytest.mark.parametrize("retry_after, expected_delay", [("5", 5.0), ("0.25", 0.25), ("120", 30.0)])
+def test_retry_after_is_honoured_up_to_the_cap(retry_after, expected_delay):
+    assert gupshup_apis.gupshup_retry_delay(gupshup_response(429, **{"Retry-After": retry_after}), 0) == expected_delay
+
+
+def test_retry_after_http_date_falls_back_to_backoff(monkeypatch):
+    monkeypatch.setattr(gupshup_apis.settings, "GUPSHUP_RETRY_BASE_DELAY", 1.0)
+    response = gupshup_response(429, **{"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"})
+
+    assert 4.0 <= gupshup_apis.gupshup_retry_delay(response, 2) <= 5.0
+
+
+def test_429_retries_stop_at_the_limit(monkeypatch):
+    monkeypatch.setattr(gupshup_apis.settings, "GUPSHUP_MAX_RETRIES", 3)
+    response = gupshup_response(429)
+
+    assert gupshup_apis.gupshup_retry_delay(response, 2) is not None
+    assert gupshup_apis.gupshup_retry_delay(response, 3) is None
+
+
+@pytest.mark.parametrize("status_code", [200, 202, 400, 500, 502, 503, 504])
+def test_only_429_responses_are_retried(status_code):
+    assert gupshup_apis.gupshup_retry_delay(gupshup_response(status_code), 0) is None
+
+
+@pytest.fixture
+def gupshup_transport(monkeypatch):
+    """Route Gupshup posts to a scripted list of responses or exceptions, without sleeping between retries"""
+    script = []
+    posts = []
+
+    def handler(request):
+        posts.append(request)
+        outcome = script.pop(0) if len(script) > 1 else script[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome, headers={"content-type": "application/json"}, json={"status": outcome})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(gupshup_apis, "gupshup_client_for", lambda url: client)
+    monkeypatch.setattr(gupshup_apis.settings, "GUPSHUP_RETRY_BASE_DELAY", 0.0)
+    monkeypatch.setattr(gupshup_apis.settings, "GUPSHUP_MAX_RETRIES", 3)
+    yield script, posts
+    asyncio.run(client.aclose())
+
+
+def send_test_message():
+    return asyncio.run(gupshup_apis.send_gupshup_request(
+        "https://api.gupshup.io/wa/api/v1/msg", "channel=whatsapp", {}
+    ))
+
+
+@pytest.mark.parametrize("status_code", [500, 502, 504])
+def test_server_errors_are_returned_without_resending(gupshup_transport, status_code):
+    script, posts = gupshup_transport
+    script.append(status_code)
+
+    result = send_test_message()
+
+    assert len(posts) == 1
+    assert result["success"] is False
+    assert result["status_code"] == status_code
+
+
+def test_rate_limited_sends_are_retried_up_to_the_limit(gupshup_transport):
+    script, posts = gupshup_transport
+    script.append(429)
+
+    result = send_test_message()
+
+    assert len(posts) == 4
+    assert result["status_code"] == 429
+
+
+def test_rate_limited_send_succeeds_on_retry(gupshup_transport):
+    script, posts = gupshup_transport
+    script.extend([429, 429, 202])
+
+    result = send_test_message()
+
+    assert len(posts) == 3
+    assert result["success"] is True
+
+
+def test_connect_errors_are_retried(gupshup_transport):
+    script, posts = gupshup_transport
+    script.extend([httpx.ConnectError("refused"), httpx.ConnectTimeout("slow"), 202])
+
+    result = send_test_message()
+
+    assert len(posts) == 3
+    assert result["success"] is True
+
+
+def test_connect_errors_stop_at_the_limit(gupshup_transport):
+    script, posts = gupshup_transport
+    script.append(httpx.ConnectError("refused"))
+
+    result = send_test_message()
+
+    assert len(posts) == 4
+    assert result["success"] is False
+    assert "refused" in result["error"]
+
+
+def test_read_timeouts_are_not_resent(gupshup_transport):
+    script, posts = gupshup_transport
+    script.append(httpx.ReadTimeout("no answer"))
+
+    result = send_test_message()
+
+    assert len(posts) == 1
+    assert result["success"] is False
+
+
+def test_single_and_bulk_sends_build_the_same_form_body(gupshup_api, gupshup_calls):
+    message = "Hi & welcome, 100% approved 🎉"
+    gupshup_api.post("/api_v1/gupshup/send-text", json={
+        "app_name": "demo", "phone_number": "9876543210", "message": message
+    })
+    gupshup_api.post("/api_v1/gupshup/send-bulk", json={
+        "app_name": "demo", "phone_numbers": ["9876543210"], "message_type": "text", "message_data": {"message": message}
+    })
+
+    single_body, bulk_body = gupshup_calls
+    assert single_body == bulk_body
+    assert parse_qs(single_body) == {
+        "channel": ["whatsapp"],
+        "source": ["919999999999"],
+        "destination": ["+919876543210"],
+        "message": [dump_json({"type": "text", "text": message})],
+    }
+
+
+def test_message_payloads_are_not_kept_in_a_cache():
+    assert not hasattr(gupshup_apis.encode_form_field, "cache_info")
+
+
+class CountingLimiter:
+    """Stands in for the app-wide AsyncLimiter and counts the tokens taken"""
+
+    def __init__(self):
+        self.acquired = 0
+
+    async def acquire(self):
+        self.acquired += 1
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+
+@pytest.mark.parametrize("pacing", [{}, {"max_rate": 1000}, {"delay_between_messages": 0}])
+def test_bulk_sends_always_take_an_app_wide_token(gupshup_api, gupshup_calls, monkeypatch, pacing):
+    limiter = CountingLimiter()
+    monkeypatch.setattr(gupshup_apis, "gupshup_rate_limiter", limiter)
+
+    response = gupshup_api.post("/api_v1/gupshup/send-bulk", json={
+        "app_name": "demo",
+        "phone_numbers": ["9876543210", "9876543211", "9876543212"],
+        "message_type": "text",
+        "message_data": {"message": "hi"},
+        **pacing,
+    })
+
+    assert response.json()["data"]["successful"] == 3
+    assert limiter.acquired == 3
+
+
+@pytest.mark.parametrize("script, expected_tokens", [
+    ([202], 0),
+    ([503], 0),
+    ([429, 429, 202], 2),
+    ([httpx.ConnectError("refused"), 202], 1),
+    ([429], 3),
+])
+def test_retries_take_an_app_wide_token(gupshup_transport, monkeypatch, script, expected_tokens):
+    limiter = CountingLimiter()
+    monkeypatch.setattr(gupshup_apis, "gupshup_rate_limiter", limiter)
+    gupshup_transport[0].extend(script)
+
+    send_test_message()
+
+    assert limiter.acquired == expected_tokens
+
+
+@pytest.mark.parametrize("path", ["/api_v1/gupshup/send-bulk", "/api_v1/gupshup/send-bulk-stream"])
+@pytest.mark.parametrize("message_type, message_data, bad_fields", [
+    ("media", {"media_type": "gif", "media_url": "https://example.com/a.gif"}, {"media_type"}),
+    ("media", {"media_type": "image"}, {"media_url"}),
+    ("template", {"template_params": ["x"]}, {"template_id"}),
+    ("template", {"template_id": "t1", "template_params": "not-a-list"}, {"template_params"}),
+    ("text", {}, {"message"}),
+])
+def test_bulk_message_data_is_validated_before_any_send(gupshup_api, gupshup_calls, path, message_type, message_data, bad_fields):
+    response = gupshup_api.post(path, json={
+        "app_name": "demo",
+        "phone_numbers": ["9876543210", "9876543211"],
+        "message_type": message_type,
+        "message_data": message_data,
+    })
+
+    assert response.status_code == 422
+    errors = response.json()["detail"]
+    assert {error["loc"][2] for error in errors} == bad_fields
+    assert all(error["loc"][:2] == ["body", "message_data"] for error in errors)
+    assert gupshup_calls == []
+
+
+def test_bulk_template_payload_uses_validated_message_data(gupshup_api, gupshup_calls):
+    response = gupshup_api.post("/api_v1/gupshup/send-bulk", json={
+        "app_name": "demo",
+        "phone_numbers": ["9876543210"],
+        "message_type": "template",
+        "message_data": {"template_id": "t1", "template_params": ["Asha"]},
+    })
+
+    assert response.json()["data"]["successful"] == 1
+    assert orjson.loads(parse_qs(gupshup_calls[0])["template"][0]) == {"id": "t1", "params": ["Asha"]}
+
+
+def queue_text_message(client):
+    return client.post(
+        "/api_v1/gupshup/send-text?async=true",
+        json={"app_name": "demo", "phone_number": "9876543210", "message": "hi"},
+    )
+
+
+def test_async_sends_are_queued_with_202(gupshup_api, gupshup_calls, send_queue):
+    response = queue_text_message(gupshup_api)
+
+    assert response.status_code == 202
+    queued_id, _ = send_queue.get_nowait()
+    assert response.json() == {
+        "success": True,
+        "message": "Message queued for sending",
+        "data": {"queued_id": queued_id},
+    }
+    assert gupshup_calls == []
+
+
+def test_async_sends_get_429_when_the_queue_is_full(gupshup_api, gupshup_calls, send_queue):
+    assert [queue_text_message(gupshup_api).status_code for _ in range(3)] == [202, 202, 429]
+    assert send_queue.qsize() == 2
+
+
+def test_async_sends_get_503_once_shutdown_closes_the_queue(gupshup_api, gupshup_calls, send_queue):
+    gupshup_apis.gupshup_send_queue_closed.set()
+
+    response = queue_text_message(gupshup_api)
+
+    assert response.status_code == 503
+    assert send_queue.empty()
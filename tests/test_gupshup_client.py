@@ -0,0 +1,100 @@
+import asyncio
+
+import httpx
+
+from app.services.gupshup_client import GupshupAdmission
+
+
+def run_cancelled_sends(cancel_while_releasing: bool) -> int:
+    """Cancel sends part-way through and return the gate's in_flight count afterwards"""
+    async def scenario():
+        gate = GupshupAdmission(2)
+
+        async def send():
+            async with gate:
+                await asyncio.sleep(0.01)
+
+        tasks = [asyncio.create_task(send()) for _ in range(5)]
+        await asyncio.sleep(0)
+        if cancel_while_releasing:
+            # Holding the condition lock makes the finished sends wait inside release()
+            async with gate.condition:
+                await asyncio.sleep(0.05)
+                for task in tasks:
+                    task.cancel()
+                await asyncio.sleep(0)
+        else:
+            for task in tasks:
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.sleep(0)
+        return gate.in_flight
+
+    return asyncio.run(scenario())
+
+
+def test_sends_cancelled_mid_request_release_their_slots():
+    assert run_cancelled_sends(cancel_while_releasing=False) == 0
+
+
+def test_sends_cancelled_while_releasing_release_their_slots():
+    assert run_cancelled_sends(cancel_while_releasing=True) == 0
+
+
+def test_released_slot_admits_a_waiter():
+    async def scenario():
+        gate = GupshupAdmission(1)
+        await gate.acquire()
+        waiter = asyncio.create_task(gate.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        await gate.release()
+        await asyncio.wait_for(waiter, timeout=1)
+        return gate.in_flight
+
+    assert asyncio.run(scenario()) == 1
+
+
+def test_cancelled_woken_waiter_passes_the_slot_on():
+    async def scenario():
+        gate = GupshupAdmission(1)
+        await gate.acquire()
+        woken = asyncio.create_task(gate.acquire())
+        next_waiter = asyncio.create_task(gate.acquire())
+        await asyncio.sleep(0)
+
+        # Free the slot and wake the first waiter the way release() does, then cancel it
+        # before it gets to run; the second waiter must still be admitted
+        async with gate.condition:
+            gate.in_flight -= 1
+            gate.condition.notify(1)
+        woken.cancel()
+        await asyncio.wait_for(next_waiter, timeout=1)
+        await asyncio.gather(woken, return_exceptions=True)
+        return gate.in_flight
+
+    assert asyncio.run(scenario()) == 1
+
+
+def test_whatsapp_service_sends_hold_an_admission_slot(monkeypatch):
+    from app.services import whatsapp_service as whatsapp_module
+
+    gate = GupshupAdmission(5)
+    in_flight_during_post = []
+
+    def handler(request):
+        in_flight_during_post.append(gate.in_flight)
+        return httpx.Response(202, json={"status": "submitted"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(whatsapp_module, "gupshup_admission", gate)
+    monkeypatch.setattr(whatsapp_module, "gupshup_client_for", lambda url: client)
+
+    async def scenario():
+        result = await whatsapp_module.whatsapp_service.send_message("+919876543210", "hi")
+        await client.aclose()
+        return result
+
+    assert asyncio.run(scenario())["success"] is True
+    assert in_flight_during_post == [1]
+    assert gate.in_flight == 0
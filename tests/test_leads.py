@@ -0,0 +1,279 @@
+import asyncio
+
+import pytest
+from cachetools import TTLCache
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from app.api.endpoints import leads
+from app.api.endpoints.leads import LEAD_COMMON_RULES, LEAD_FLASH_RULES, ORBIT_LEAD_RULES, apply_lead_rules
+from app.models.schemas import LeadCreateRequest, LeadCreateResponse, LeadFlashRequest
+from app.utils.validators import (
+    validate_credit_score, validate_email, validate_first_name, validate_gender, validate_last_name,
+    validate_loan_amount, validate_loan_tenure, validate_loan_type, validate_mobile_number,
+    validate_pan_number, validate_pin_code
+)
+
+LEAD = {
+    "environment": "orbit",
+    "firstName": "Asha",
+    "lastName": "Rao",
+    "gender": "Female",
+    "mobile": "9876543210",
+    "pan": "ABCDE1234F",
+    "email": "asha@example.com",
+    "pincode": "560001",
+    "loanType": "home_loan",
+    "loanTenure": 20,
+    "loanAmountReq": 5000000,
+    "dateOfBirth": "1990-01-01",
+    "creditScore": 750,
+}
+LEAD_FLASH = {**LEAD, "applicationId": "app-1", "professionId": "p-1", "professionName": "Salaried"}
+
+
+# ==================== IDEMPOTENT CREATE ====================
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Replace create_lead with a recorder and give the idempotency cache a controllable clock"""
+    calls = []
+    clock = [0.0]
+
+    async def fake_create_lead(request):
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return LeadCreateResponse(
+            basic_application_id=f"B{len(calls)}", applicationId="app", reference_id="ref", message="created"
+        )
+
+    monkeypatch.setattr(leads, "create_lead", fake_create_lead)
+    monkeypatch.setattr(leads, "created_leads_cache", TTLCache(maxsize=100, ttl=60, timer=lambda: clock[0]))
+    return calls, clock
+
+
+def create(**overrides):
+    return leads.create_lead_api(LeadCreateRequest(**{**LEAD, **overrides}))
+
+
+def test_identical_retry_within_ttl_returns_cached_response(upstream):
+    calls, clock = upstream
+
+    async def scenario():
+        first = await create()
+        clock[0] = 59
+        second = await create()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert second is first
+    assert len(calls) == 1
+
+
+def test_identical_retry_after_ttl_calls_upstream_again(upstream):
+    calls, clock = upstream
+
+    async def scenario():
+        await create()
+        clock[0] = 61
+        return await create()
+
+    assert asyncio.run(scenario()).basic_application_id == "B2"
+    assert len(calls) == 2
+
+
+def test_changed_payload_for_same_mobile_and_pan_calls_upstream_again(upstream):
+    calls, _ = upstream
+
+    async def scenario():
+        first = await create()
+        changed = await create(loanAmountReq=6000000)
+        changed_retry = await create(loanAmountReq=6000000)
+        return first, changed, changed_retry
+
+    first, changed, changed_retry = asyncio.run(scenario())
+
+    assert changed.basic_application_id != first.basic_application_id
+    assert changed_retry is changed
+    assert len(calls) == 2
+
+
+def test_concurrent_duplicates_call_upstream_once(upstream):
+    calls, _ = upstream
+
+    async def scenario():
+        return await asyncio.gather(*(create() for _ in range(5)))
+
+    responses = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert all(response is responses[0] for response in responses)
+
+
+def test_failed_creation_is_not_cached(upstream, monkeypatch):
+    calls, _ = upstream
+
+    async def failing_create_lead(request):
+        calls.append(request)
+        raise HTTPException(status_code=400, detail="FBB creation failed")
+
+    monkeypatch.setattr(leads, "create_lead", failing_create_lead)
+
+    async def scenario():
+        for _ in range(2):
+            with pytest.raises(HTTPException):
+                await create()
+
+    asyncio.run(scenario())
+
+    assert len(calls) == 2
+
+
+# ==================== RULE TABLES ====================
+
+def old_validation_rejects(data: dict, flash: bool = False) -> bool:
+    """The checks the per-environment validators made before the rule tables replaced them"""
+    if data["environment"] not in ("orbit", "homfinity"):
+        return True
+    checks = [
+        validate_loan_type(data["loanType"]),
+        validate_loan_amount(data["loanAmountReq"]),
+        validate_mobile_number(data["mobile"]),
+        validate_pin_code(data["pincode"]),
+        validate_email(data["email"]),
+        validate_first_name(data["firstName"]),
+        validate_last_name(data["lastName"]),
+    ]
+    if data["environment"] == "orbit":
+        checks += [
+            validate_loan_tenure(data["loanTenure"]),
+            validate_pan_number(data["pan"]),
+            validate_credit_score(data["creditScore"]),
+            validate_gender(data["gender"]),
+        ]
+    if flash:
+        checks.append(bool(data["applicationId"]))
+    return not all(checks)
+
+
+def new_validation_rejects(data: dict, flash: bool = False) -> bool:
+    """Request schema parsing followed by the rule table for the environment"""
+    model = LeadFlashRequest if flash else LeadCreateRequest
+    try:
+        request = model(**data)
+    except ValidationError:
+        return True
+
+    if flash:
+        rules = LEAD_FLASH_RULES[request.environment]
+    else:
+        rules = ORBIT_LEAD_RULES if request.environment == "orbit" else LEAD_COMMON_RULES
+    try:
+        apply_lead_rules(request, rules)
+    except HTTPException as e:
+        assert e.status_code == 422
+        return True
+    return False
+
+
+# Fields the rule tables check for every environment
+COMMON_BAD_FIELDS = [
+    {"loanType": "car loan"},
+]
+ORBIT_ONLY_BAD_FIELDS = [
+    {"loanTenure": 0},
+    {"pan": "abcde1234f"},
+    {"pan": "ABCDE12345"},
+    {"creditScore": 0},
+    {"creditScore": 1001},
+    {"gender": ""},
+    {"gender": "   "},
+]
+
+
+@pytest.mark.parametrize("flash", [False, True], ids=["create", "flash"])
+@pytest.mark.parametrize("environment", ["orbit", "homfinity"])
+def test_valid_leads_are_accepted(environment, flash):
+    data = {**(LEAD_FLASH if flash else LEAD), "environment": environment}
+
+    assert not old_validation_rejects(data, flash)
+    assert not new_validation_rejects(data, flash)
+
+
+@pytest.mark.parametrize("flash", [False, True], ids=["create", "flash"])
+@pytest.mark.parametrize("environment", ["orbit", "homfinity"])
+@pytest.mark.parametrize("bad_field", COMMON_BAD_FIELDS, ids=str)
+def test_common_rules_reject_what_the_old_validators_rejected(bad_field, environment, flash):
+    data = {**(LEAD_FLASH if flash else LEAD), "environment": environment, **bad_field}
+
+    assert old_validation_rejects(data, flash)
+    assert new_validation_rejects(data, flash)
+
+
+@pytest.mark.parametrize("flash", [False, True], ids=["create", "flash"])
+@pytest.mark.parametrize("bad_field", ORBIT_ONLY_BAD_FIELDS, ids=str)
+def test_orbit_rules_reject_what_the_old_orbit_validator_rejected(bad_field, flash):
+    data = {**(LEAD_FLASH if flash else LEAD), "environment": "orbit", **bad_field}
+
+    assert old_validation_rejects(data, flash)
+    assert new_validation_rejects(data, flash)
+
+
+@pytest.mark.parametrize("flash", [False, True], ids=["create", "flash"])
+@pytest.mark.parametrize("bad_field", ORBIT_ONLY_BAD_FIELDS, ids=str)
+def test_homfinity_rules_keep_accepting_orbit_only_fields(bad_field, flash):
+    data = {**(LEAD_FLASH if flash else LEAD), "environment": "homfinity", **bad_field}
+
+    assert not old_validation_rejects(data, flash)
+    assert not new_validation_rejects(data, flash)
+
+
+@pytest.mark.parametrize("environment", ["orbit", "homfinity"])
+def test_flash_rules_require_an_application_id(environment):
+    data = {**LEAD_FLASH, "environment": environment, "applicationId": ""}
+
+    assert old_validation_rejects(data, flash=True)
+    assert new_validation_rejects(data, flash=True)
+    assert not new_validation_rejects({**LEAD, "environment": environment})
+
+
+# Fields the request schemas now check instead of the common validators
+SCHEMA_BAD_FIELDS = [
+    {"environment": "staging"},
+    {"loanAmountReq": 0},
+    {"loanAmountReq": -1},
+    {"mobile": "98765"},
+    {"mobile": "98765432101"},
+    {"pincode": "5600"},
+    {"email": ""},
+    {"firstName": ""},
+    {"firstName": "   "},
+    {"lastName": ""},
+]
+
+
+@pytest.mark.parametrize("flash", [False, True], ids=["create", "flash"])
+@pytest.mark.parametrize("environment", ["orbit", "homfinity"])
+@pytest.mark.parametrize("bad_field", SCHEMA_BAD_FIELDS, ids=str)
+def test_schemas_reject_what_the_old_common_validators_rejected(bad_field, environment, flash):
+    data = {**(LEAD_FLASH if flash else LEAD), "environment": environment, **bad_field}
+
+    assert old_validation_rejects(data, flash)
+    with pytest.raises(ValidationError):
+        (LeadFlashRequest if flash else LeadCreateRequest)(**data)
+
+
+@pytest.mark.parametrize("model, data", [(LeadCreateRequest, LEAD), (LeadFlashRequest, LEAD_FLASH)])
+def test_lead_requests_are_frozen(model, data):
+    request = model(**data)
+
+    with pytest.raises(ValidationError):
+        request.mobile = "9876500000"
+
+
+@pytest.mark.parametrize("bad_field", [{"mobile": " 9876543210"}, {"pincode": "560001 "}], ids=str)
+def test_lead_requests_do_not_strip_whitespace(bad_field):
+    with pytest.raises(ValidationError):
+        LeadCreateRequest(**{**LEAD, **bad_field})
+    assert LeadCreateRequest(**{**LEAD, "firstName": " Asha "}).firstName == " Asha "
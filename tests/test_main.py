@@ -0,0 +1,42 @@
+import asyncio
+import importlib
+
+import pytest
+
+from app.api.endpoints import gupshup_apis
+
+
+@pytest.fixture
+def main(monkeypatch, tmp_path):
+    """app.main imported from a scratch directory, so its log file is written there"""
+    monkeypatch.chdir(tmp_path)
+    return importlib.import_module("app.main")
+
+
+def test_shutdown_drains_queued_sends_before_closing_clients(main, send_queue, monkeypatch):
+    events = []
+
+    async def send():
+        await asyncio.sleep(0.01)
+        events.append("sent")
+        return {"success": True}
+
+    async def close_clients():
+        events.append("clients closed")
+
+    monkeypatch.setattr(main.settings, "GUPSHUP_WORKERS", 1)
+    monkeypatch.setattr(main.basic_http_client, "aclose", close_clients)
+    monkeypatch.setattr(main, "close_gupshup_clients", close_clients)
+    monkeypatch.setattr(main.log_listener, "stop", lambda: events.append("logs flushed"))
+
+    async def scenario():
+        async with main.lifespan(main.app):
+            gupshup_apis.enqueue_gupshup_send(send)
+            gupshup_apis.enqueue_gupshup_send(send)
+        return main.app.state.gupshup_send_workers
+
+    workers = asyncio.run(scenario())
+
+    assert events == ["sent", "sent", "clients closed", "clients closed", "logs flushed"]
+    assert send_queue.empty()
+    assert all(worker.cancelled() for worker in workers)